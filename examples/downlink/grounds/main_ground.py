@@ -7,8 +7,10 @@
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from dotenv import dotenv_values
+import numpy as np
 
 from nost_tools.application_utils import ConnectionConfig, ShutDownObserver # type: ignore
 from nost_tools.simulator import Simulator, Mode # type: ignore
@@ -33,6 +35,75 @@ from ground_config_files.config import ( # type: ignore
 
 logging.basicConfig(level=logging.INFO)
 
+def to_datetime64(time):
+    """
+    Converts a timezone-aware :obj:`datetime` to a naive UTC :obj:`datetime64` with microsecond resolution.
+    """
+    return np.datetime64(time.astimezone(timezone.utc).replace(tzinfo=None), "us")
+
+class LinkLog:
+    """
+    Growable struct-of-arrays record of the sequential downlink opportunities of a single satellite.
+
+    Attributes:
+        records (:obj:`ndarray`): Structured array of links with groundId (*int*), linkId (*int*), start and end (:obj:`datetime64`), duration (*float*) in seconds, initialData (*float*), dataOffload (*float*), and downlinkCost (*float*) fields - *NOTE:* preallocated, only the first **count** rows are valid
+        count (int): Number of links recorded
+    """
+
+    DTYPE = np.dtype(
+        [
+            ("groundId", "i4"),
+            ("linkId", "i4"),
+            ("start", "datetime64[us]"),
+            ("end", "datetime64[us]"),
+            ("duration", "f8"),
+            ("initialData", "f8"),
+            ("dataOffload", "f8"),
+            ("downlinkCost", "f8"),
+        ]
+    )
+
+    def __init__(self, capacity=1024):
+        self.records = np.zeros(capacity, dtype=self.DTYPE)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        return self.records[: self.count][index]
+
+    def append(self, groundId, linkId, start, initialData):
+        """
+        Records the start of a new link, doubling the preallocated capacity when full.
+
+        Returns:
+            :obj:`void` : link
+                The new record, whose fields write through to **records**
+        """
+        if self.count == len(self.records):
+            self.records = np.concatenate((self.records, np.zeros_like(self.records)))
+        link = self.records[self.count]
+        link["groundId"] = groundId
+        link["linkId"] = linkId
+        link["start"] = to_datetime64(start)
+        link["initialData"] = initialData
+        self.count += 1
+        return link
+
+@dataclass
+class SatView:
+    """
+    Downlink state of a single satellite.
+
+    Attributes:
+        on (bool): True, if the satellite is currently in range of a ground station
+        linkCount (int): Number of completed downlink opportunities
+    """
+
+    on: bool = False
+    linkCount: int = 0
+
 # define an observer to manage ground updates
 class GroundNetwork(Observable,Observer):
     """
@@ -50,9 +121,32 @@ class GroundNetwork(Observable,Observer):
         super().__init__()
         self.app = app
         self.grounds = grounds
-        self.satelliteIds = []
-        self.satelliteNames = []
-        self.ssrCapacity = []
+        # link rates and costs are fixed, so plain arrays avoid pandas indexing on every link charge
+        self._downlinkRate = grounds["downlinkRate"].to_numpy()
+        self._costPerSecond = grounds["costPerSecond"].to_numpy()
+        self._costMode = grounds["costMode"].to_numpy()
+        # every other location field is static, so each station's message is serialized up front
+        # for both operational states, indexed by the operational flag
+        self._locationPayloads = [
+            tuple(
+                GroundLocation(**ground, operational=operational).model_dump_json()
+                for operational in (False, True)
+            )
+            for ground in grounds[
+                [
+                    "groundId",
+                    "latitude",
+                    "longitude",
+                    "elevAngle",
+                    "downlinkRate",
+                    "costPerSecond",
+                    "costMode",
+                ]
+            ].to_dict("records")
+        ]
+        # satellite names and recorder capacities keyed by satellite id, so arrival order does not matter
+        self.satelliteNames = {}
+        self.ssrCapacity = {}
         self.outages = []
         self.restores = []
         self.cumulativeCosts = 0.00
@@ -65,26 +159,17 @@ class GroundNetwork(Observable,Observer):
 
         """
         if property_name == Simulator.PROPERTY_MODE and new_value == Mode.EXECUTING:
-            for index, ground in self.grounds.iterrows():
-                self.app.send_message(
-                    "location",
-                    GroundLocation(
-                        groundId=ground.groundId,
-                        latitude=ground.latitude,
-                        longitude=ground.longitude,
-                        elevAngle=ground.elevAngle,
-                        operational=ground.operational,
-                        downlinkRate=ground.downlinkRate,
-                        costPerSecond=ground.costPerSecond,
-                        costMode=ground.costMode
-                    ).json()
-                )
+            # operational changes with outages and restores, so the payload for its current value is picked at send time
+            for payloads, operational in zip(
+                self._locationPayloads, self.grounds["operational"].to_numpy()
+            ):
+                self.app.send_message("location", payloads[bool(operational)])
 
     def on_ready(self, client, userdata, message):
         """
         Callback function for subscribed messages on the *PREFIX/constellation/ready* topic.
         
-        For each message received, appends a satellite and its specs to internal lists.
+        For each message received, records a satellite and its specs keyed by satellite id.
 
         Args:
             client (:obj:`MQTT Client`): Client that connects application to the event broker using the MQTT protocol. Includes user credentials, tls certificates, and host server-port information.
@@ -93,15 +178,14 @@ class GroundNetwork(Observable,Observer):
 
         """
         ready = SatelliteReady.parse_raw(message.payload)
-        self.satelliteIds.append(ready.id)
-        self.satelliteNames.append(ready.name)
-        self.ssrCapacity.append(ready.ssr_capacity)
+        self.satelliteNames[ready.id] = ready.name
+        self.ssrCapacity[ready.id] = ready.ssr_capacity
 
     def all_ready(self, client, userdata, message):
         """
         Callback function for subscribed messages on the *PREFIX/constellation/allReady* topic.
         
-        This is a simple trigger that the list of constituent satellites have been finalized and appended to lists.
+        This is a simple trigger that the list of constituent satellites have been finalized and recorded.
 
         Args:
             client (:obj:`MQTT Client`): Client that connects application to the event broker using the MQTT protocol. Includes user credentials, tls certificates, and host server-port information.
@@ -109,10 +193,10 @@ class GroundNetwork(Observable,Observer):
             message (:obj:`message`): Contains *topic* the client subscribed to and *payload* message content as attributes.
 
         """
-        self.groundTimes = {j:[] for j in self.satelliteNames}
-        self.satView = {k:{"on":False,"linkCount":0} for k in self.satelliteNames}
-        self.cumulativeCostBySat = {l:0.00 for l in self.satelliteNames}
-        for i,l in enumerate(self.satelliteNames):
+        self.groundTimes = {j:LinkLog() for j in self.satelliteNames.values()}
+        self.satView = {k:SatView() for k in self.satelliteNames.values()}
+        self.cumulativeCostBySat = {l:0.00 for l in self.satelliteNames.values()}
+        for i,l in self.satelliteNames.items():
             self.app.send_message(
                     "linkStart",
                     LinkStart(
@@ -122,7 +206,7 @@ class GroundNetwork(Observable,Observer):
                         linkId = -1,
                         start = self.app.simulator.get_time(),
                         data = 0.0
-                    ).json(),
+                    ).model_dump_json(),
                 )
             self.app.send_message(
                     "linkCharge",
@@ -137,7 +221,7 @@ class GroundNetwork(Observable,Observer):
                         downlinkCost = 0.00,
                         cumulativeCostBySat = self.cumulativeCostBySat[l],
                         cumulativeCosts = 0.00
-                    ).json()
+                    ).model_dump_json()
                 )
 
     def on_commRange(self, client, userdata, message):
@@ -153,65 +237,63 @@ class GroundNetwork(Observable,Observer):
 
         """
         satInView = SatelliteState.parse_raw(message.payload)
-        if self.satView[satInView.name]["on"]:
+        name = satInView.name
+        view = self.satView[name]
+        times = self.groundTimes[name]
+        if view.on:
             if not satInView.commRange:
-                self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["end"] = satInView.time
-                self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["duration"] = (self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["end"]
-                     - self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["start"]).total_seconds()
-                self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["dataOffload"] = self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["duration"]*self.grounds["downlinkRate"][self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["groundId"]]
-                self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["downlinkCost"] = self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["duration"]*self.grounds["costPerSecond"][self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["groundId"]]
-                if self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["dataOffload"] > self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["initialData"]:
-                    self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["dataOffload"] = self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["initialData"]
-                    self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["downlinkCost"] = (self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["dataOffload"]/self.grounds["downlinkRate"][self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["groundId"]])*self.grounds["costPerSecond"][self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["groundId"]]
-                if self.grounds["costMode"][self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["groundId"]] == "continuous":
-                    self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["downlinkCost"] = 0.00
-                self.cumulativeCostBySat[satInView.name] = self.cumulativeCostBySat[satInView.name]+self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["downlinkCost"]
-                self.cumulativeCosts = self.cumulativeCosts + self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["downlinkCost"]
+                link = times[view.linkCount]
+                groundId = int(link["groundId"])
+                downlinkRate = self._downlinkRate[groundId]
+                costPerSecond = self._costPerSecond[groundId]
+                link["end"] = to_datetime64(satInView.time)
+                link["duration"] = (link["end"] - link["start"]) / np.timedelta64(1, "s")
+                link["dataOffload"] = link["duration"]*downlinkRate
+                link["downlinkCost"] = link["duration"]*costPerSecond
+                if link["dataOffload"] > link["initialData"]:
+                    link["dataOffload"] = link["initialData"]
+                    link["downlinkCost"] = (link["dataOffload"]/downlinkRate)*costPerSecond
+                if self._costMode[groundId] == "continuous":
+                    link["downlinkCost"] = 0.00
+                self.cumulativeCostBySat[name] = self.cumulativeCostBySat[name]+link["downlinkCost"]
+                self.cumulativeCosts = self.cumulativeCosts + link["downlinkCost"]
                 self.notify_observers(
                         self.PROPERTY_OUT_OF_RANGE,
                         None,
                         {
-                            "groundId":self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["groundId"],
+                            "groundId":groundId,
                             "satId":satInView.id,
-                            "satName":satInView.name,
-                            "linkId":self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["linkId"],
-                            "end":self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["end"],
-                            "duration":self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["duration"],
-                            "dataOffload":self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["dataOffload"],
-                            "downlinkCost":self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["downlinkCost"],
-                            "cumulativeCostBySat":self.cumulativeCostBySat[satInView.name],
+                            "satName":name,
+                            "linkId":int(link["linkId"]),
+                            "end":satInView.time,
+                            "duration":float(link["duration"]),
+                            "dataOffload":link["dataOffload"],
+                            "downlinkCost":link["downlinkCost"],
+                            "cumulativeCostBySat":self.cumulativeCostBySat[name],
                             "cumulativeCosts":self.cumulativeCosts
                             },
                         )
-                self.satView[satInView.name]["on"] = False
-                self.satView[satInView.name]["linkCount"] = self.satView[satInView.name]["linkCount"]+1
+                view.on = False
+                view.linkCount += 1
 
         elif satInView.commRange:
-            self.groundTimes[satInView.name].append(
-                {
-                    "groundId":satInView.groundId,
-                    "satId":satInView.id,
-                    "satName":satInView.name,
-                    "linkId":self.satView[satInView.name]["linkCount"],
-                    "start":satInView.time,
-                    "end":None,
-                    "duration":None,
-                    "initialData": satInView.capacity_used,
-                    "dataOffload":None,
-                    "downlinkCost":None
-                },
+            link = times.append(
+                satInView.groundId,
+                view.linkCount,
+                satInView.time,
+                satInView.capacity_used,
             )
-            self.satView[satInView.name]["on"] = True
+            view.on = True
             self.notify_observers(
                     self.PROPERTY_IN_RANGE,
                     None,
                     {
-                        "groundId":self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["groundId"],
+                        "groundId":satInView.groundId,
                         "satId":satInView.id,
-                        "satName":satInView.name,
-                        "linkId":self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["linkId"],
+                        "satName":name,
+                        "linkId":int(link["linkId"]),
                         "start":satInView.time,
-                        "data":self.groundTimes[satInView.name][self.satView[satInView.name]["linkCount"]]["initialData"]
+                        "data":satInView.capacity_used
                     },
                 )
             
@@ -300,14 +382,15 @@ class LinkStartObserver(Observer):
         if property_name == GroundNetwork.PROPERTY_IN_RANGE:
             self.app.send_message(
                     "linkStart",
-                    LinkStart(
+                    # values are produced by GroundNetwork itself, so validation is skipped
+                    LinkStart.model_construct(
                         groundId = new_value["groundId"],
                         satId = new_value["satId"],
                         satName = new_value["satName"],
                         linkId = new_value["linkId"],
                         start = new_value["start"],
                         data = new_value["data"]
-                    ).json(),
+                    ).model_dump_json(),
                 )
 
 class LinkEndObserver(Observer):
@@ -332,7 +415,8 @@ class LinkEndObserver(Observer):
         if property_name == GroundNetwork.PROPERTY_OUT_OF_RANGE:
             self.app.send_message(
                     "linkCharge",
-                    LinkCharge(
+                    # values are produced by GroundNetwork itself, so validation is skipped
+                    LinkCharge.model_construct(
                         groundId = new_value["groundId"],
                         satId = new_value["satId"],
                         satName = new_value["satName"],
@@ -343,7 +427,7 @@ class LinkEndObserver(Observer):
                         downlinkCost = new_value["downlinkCost"],
                         cumulativeCostBySat = new_value["cumulativeCostBySat"],
                         cumulativeCosts = new_value["cumulativeCosts"]
-                    ).json()
+                    ).model_dump_json()
                 )
 
 
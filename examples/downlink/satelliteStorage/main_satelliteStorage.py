@@ -175,7 +175,7 @@ class SatelliteStorage(Entity):
             }
         )
         self.positions = self.next_positions = [
-            wgs84.subpoint(satellite.at(self.ts.from_datetime(init_time)))
+            wgs84.geographic_position_of(satellite.at(self.ts.from_datetime(init_time)))
             for satellite in self.satellites
         ]
 
@@ -201,7 +201,7 @@ class SatelliteStorage(Entity):
         # tik = time.time()
         super().tick(time_step)
         self.next_positions = [
-            wgs84.subpoint(
+            wgs84.geographic_position_of(
                 satellite.at(self.ts.from_datetime(self.get_time() + time_step))
             )
             for satellite in self.satellites
@@ -429,7 +429,7 @@ class SatStatePublisher(WallclockTimeIntervalPublisher):
                 constellation.get_time() + 60 * self.time_status_step
             )
             satSpaceTime = satellite.at(next_time)
-            subpoint = wgs84.subpoint(satSpaceTime)
+            subpoint = wgs84.geographic_position_of(satSpaceTime)
             self.isInRange[i], groundId = check_in_range(
                 next_time, satellite, constellation.grounds
             )
@@ -466,7 +466,12 @@ if __name__ == "__main__":
 
     # load current TLEs for active satellites from Celestrak (NOTE: User has option to specify their own TLE instead)
     activesats_url = "https://celestrak.com/NORAD/elements/active.txt"
-    activesats = load.tle_file(activesats_url, reload=True)
+    # reuse the local copy, downloading again only when it is missing or more than six hours old
+    activesats = load.tle_file(
+        activesats_url,
+        reload=not load.exists("active.txt") or load.days_old("active.txt") > 0.25,
+        filename="active.txt",
+    )
     by_name = {sat.name: sat for sat in activesats}
 
     # keys for CelesTrak TLEs used in this example, but indexes often change over time)
@@ -52,18 +52,17 @@ class Environment(Observer):
 
         """
         if property_name == Simulator.PROPERTY_MODE and new_value == Mode.EXECUTING:
-            for index, ground in self.grounds.iterrows():
-                self.app.send_message(
-                    self.app.app_name,
-                    "location",
-                    GroundLocation(
-                        groundId=ground.groundId,
-                        latitude=ground.latitude,
-                        longitude=ground.longitude,
-                        elevAngle=ground.elevAngle,
-                        operational=ground.operational,
-                    ).json(),
-                )
+            # plain records avoid constructing a pandas Series for every row
+            self.app.send_messages(
+                self.app.app_name,
+                "location",
+                [
+                    GroundLocation(**ground).model_dump_json()
+                    for ground in self.grounds[
+                        ["groundId", "latitude", "longitude", "elevAngle", "operational"]
+                    ].to_dict("records")
+                ],
+            )
 
 if __name__ == "__main__":
     # Load credentials from a .env file in current working directory
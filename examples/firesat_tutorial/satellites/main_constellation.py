@@ -1,10 +1,15 @@
 import logging
+import math
 from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import dotenv_values
 import numpy as np
 import pandas as pd
-import copy
+from sgp4.api import SatrecArray
+from sgp4.conveniences import jday_datetime
 from skyfield.api import load, wgs84, EarthSatellite
+from skyfield.functions import rot_z
+from skyfield.sgp4lib import theta_GMST1982
 import threading
 
 from nost_tools.application_utils import ConnectionConfig, ShutDownObserver
@@ -12,6 +17,7 @@ from nost_tools.entity import Entity
 from nost_tools.observer import Observer
 from nost_tools.managed_application import ManagedApplication
 from nost_tools.publisher import WallclockTimeIntervalPublisher
+from nost_tools.simulator import Simulator, Mode
 
 from constellation_config_files.schemas import (
     FireStarted,
@@ -33,31 +39,39 @@ logging.basicConfig(level=logging.INFO)
 
 logger = logging.getLogger() #__name__)
 
+EARTH_EQUATORIAL_RADIUS = 6378137.0  # meters
+EARTH_POLAR_RADIUS = 6356752.314245179  # meters
+EARTH_MEAN_RADIUS = (2 * EARTH_EQUATORIAL_RADIUS + EARTH_POLAR_RADIUS) / 3  # meters
+
 def compute_min_elevation(altitude, field_of_regard):
     """
     Computes the minimum elevation angle required for a satellite to observe a point from current location.
 
     Args:
-        altitude (float): Altitude (meters) above surface of the observation
-        field_of_regard (float): Angular width (degrees) of observation
+        altitude (float or :obj:`ndarray`): Altitude (meters) above surface of the observation
+        field_of_regard (float or :obj:`ndarray`): Angular width (degrees) of observation
 
     Returns:
-        float : min_elevation
+        float or :obj:`ndarray` : min_elevation
             The minimum elevation angle (degrees) for observation
     """
-    earth_equatorial_radius = 6378137.000000000
-    earth_polar_radius = 6356752.314245179
-    earth_mean_radius = (2 * earth_equatorial_radius + earth_polar_radius) / 3
-
+    if not isinstance(altitude, np.ndarray) and not isinstance(field_of_regard, np.ndarray):
+        # scalar path avoids the NumPy ufunc dispatch overhead
+        sin_eta = math.sin(math.radians(field_of_regard / 2))
+        sin_rho = EARTH_MEAN_RADIUS / (EARTH_MEAN_RADIUS + altitude)
+        cos_epsilon = sin_eta / sin_rho
+        if cos_epsilon > 1:
+            return 0.0
+        return math.degrees(math.acos(cos_epsilon))
     # eta is the angular radius of the region viewable by the satellite
-    sin_eta = np.sin(np.radians(field_of_regard / 2))
+    sin_eta = np.sin(np.radians(np.asarray(field_of_regard) / 2))
     # rho is the angular radius of the earth viewed by the satellite
-    sin_rho = earth_mean_radius / (earth_mean_radius + altitude)
+    sin_rho = EARTH_MEAN_RADIUS / (EARTH_MEAN_RADIUS + np.asarray(altitude))
     # epsilon is the min satellite elevation for obs (grazing angle)
     cos_epsilon = sin_eta / sin_rho
-    if cos_epsilon > 1:
-        return 0.0
-    return np.degrees(np.arccos(cos_epsilon))
+    return np.where(
+        cos_epsilon > 1, 0.0, np.degrees(np.arccos(np.minimum(cos_epsilon, 1.0)))
+    )[()]
 
 
 def compute_sensor_radius(altitude, min_elevation):
@@ -65,95 +79,170 @@ def compute_sensor_radius(altitude, min_elevation):
     Computes the sensor radius for a satellite at current altitude given minimum elevation constraints.
 
     Args:
-        altitude (float): Altitude (meters) above surface of the observation
-        min_elevation (float): Minimum angle (degrees) with horizon for visibility
+        altitude (float or :obj:`ndarray`): Altitude (meters) above surface of the observation
+        min_elevation (float or :obj:`ndarray`): Minimum angle (degrees) with horizon for visibility
 
     Returns:
-        float : sensor_radius
+        float or :obj:`ndarray` : sensor_radius
             The radius (meters) of the nadir pointing sensors circular view of observation
     """
-    earth_equatorial_radius = 6378137.0
-    earth_polar_radius = 6356752.314245179
-    earth_mean_radius = (2 * earth_equatorial_radius + earth_polar_radius) / 3
+    if not isinstance(altitude, np.ndarray) and not isinstance(min_elevation, np.ndarray):
+        # scalar path avoids the NumPy ufunc dispatch overhead
+        sin_rho = EARTH_MEAN_RADIUS / (EARTH_MEAN_RADIUS + altitude)
+        eta = math.degrees(math.asin(math.cos(math.radians(min_elevation)) * sin_rho))
+        sw_HalfAngle = 90 - eta - min_elevation
+        if sw_HalfAngle < 0.0:
+            return 0.0
+        return EARTH_MEAN_RADIUS * math.radians(sw_HalfAngle)
     # rho is the angular radius of the earth viewed by the satellite
-    sin_rho = earth_mean_radius / (earth_mean_radius + altitude)
+    sin_rho = EARTH_MEAN_RADIUS / (EARTH_MEAN_RADIUS + np.asarray(altitude))
     # eta is the nadir angle between the sub-satellite direction and the target location on the surface
     eta = np.degrees(np.arcsin(np.cos(np.radians(min_elevation)) * sin_rho))
     # calculate swath width half angle from trigonometry
     sw_HalfAngle = 90 - eta - min_elevation
-    if sw_HalfAngle < 0.0:
-        return 0.0
-    return earth_mean_radius * np.radians(sw_HalfAngle)
+    return np.where(
+        sw_HalfAngle < 0.0, 0.0, EARTH_MEAN_RADIUS * np.radians(sw_HalfAngle)
+    )[()]
 
 
-def get_elevation_angle(t, sat, loc):
+def propagate_itrf(satellites, t):
     """
-    Returns the elevation angle (degrees) of satellite with respect to the topocentric horizon.
+    Propagates all satellites to a common time in a single SGP4 call and returns their positions in the International Terrestrial Reference Frame (ITRF).
 
     Args:
+        satellites (:obj:`SatrecArray`): Array of SGP4 satellite records from the sgp4.api module
         t (:obj:`Time`): Time object of skyfield.timelib module
-        sat (:obj:`EarthSatellite`): Skyview EarthSatellite object from skyfield.sgp4lib module
-        loc (:obj:`GeographicPosition`): Geographic location on surface specified by latitude-longitude from skyfield.toposlib module
 
     Returns:
-        float : alt.degrees
-            Elevation angle (degrees) of satellite with respect to the topocentric horizon
+        :obj:`ndarray` : r_itrf
+            Array of shape (N, 3) with the position (km) of each satellite in the ITRF
+    """
+    jd, fr = jday_datetime(t.utc_datetime())
+    e, r, v = satellites.sgp4(np.array([jd]), np.array([fr]))
+    # TEME and ITRF differ by a rotation about the z-axis through Greenwich sidereal time (polar motion neglected)
+    theta, theta_dot = theta_GMST1982(t.whole, t.ut1_fraction)
+    # NOTE: SatrecArray returns arrays of shape (N, 1, 3) for a single time
+    return r[:, 0, :].dot(rot_z(-theta).T)
+
+
+def itrf_to_geodetic(r_itrf):
+    """
+    Converts positions in the International Terrestrial Reference Frame (ITRF) to geodetic coordinates on the WGS84 ellipsoid.
+
+    Args:
+        r_itrf (:obj:`ndarray`): Array of shape (N, 3) with positions (km) in the ITRF, as computed by propagate_itrf
+
+    Returns:
+        :obj:`ndarray` : positions
+            Array of shape (N, 3) with the latitude (degrees), longitude (degrees), and altitude (meters) of each position
+    """
+    x, y, z = r_itrf.T
+    a = wgs84.radius.km
+    e2 = wgs84._e2
+    R = np.hypot(x, y)
+    lat = np.arctan2(z, R)
+    # fixed-point iteration on the geodetic latitude, converged well below a millimeter after three steps for LEO
+    for iteration in range(3):
+        e2_sin_lat = e2 * np.sin(lat)
+        aC = a / np.sqrt(1.0 - e2_sin_lat * np.sin(lat))
+        hyp = z + aC * e2_sin_lat
+        lat = np.arctan2(hyp, R)
+    lon = np.arctan2(y, x)
+    alt = (np.hypot(hyp, R) - aC) * 1000
+    return np.column_stack((np.degrees(lat), np.degrees(lon), alt))
+
+
+def get_location_vectors(latitude, longitude):
     """
-    difference = sat - loc
-    topocentric = difference.at(t)
-    # NOTE: Topos uses term altitude for what we are referring to as elevation
-    alt, az, distance = topocentric.altaz()
-    return alt.degrees
+    Computes the position and local zenith direction of a geographic location in the International Terrestrial Reference Frame (ITRF).
+
+    Args:
+        latitude (float): Latitude (degrees) of the location on the surface
+        longitude (float): Longitude (degrees) of the location on the surface
+
+    Returns:
+        :obj:`ndarray`, :obj:`ndarray` :
+            r_loc
+                Position (km) of the location in the ITRF
+            zenith
+                Unit vector normal to the WGS84 ellipsoid at the location
+    """
+    loc = wgs84.latlon(latitude, longitude)
+    lat, lon = loc.latitude.radians, loc.longitude.radians
+    zenith = np.array(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+    )
+    return loc.itrs_xyz.km, zenith
 
 
-def check_in_view(t, satellite, topos, min_elevation):
+def get_elevation_angle(r_sat, r_loc, zenith):
+    """
+    Returns the elevation angle (degrees) of satellite with respect to the topocentric horizon.
+
+    Args:
+        r_sat (:obj:`ndarray`): Position (km) of the satellite in the International Terrestrial Reference Frame (ITRF), as computed by propagate_itrf
+        r_loc (:obj:`ndarray`): Position (km) of the location in the ITRF, as computed by get_location_vectors, or array of shape (M, 3) for M locations
+        zenith (:obj:`ndarray`): Unit vector of the local zenith at the location, as computed by get_location_vectors, or array of shape (M, 3) for M locations
+
+    Returns:
+        float or :obj:`ndarray` : elevation
+            Elevation angle (degrees) of satellite with respect to the topocentric horizon of each location
+    """
+    r_rel = r_sat - r_loc
+    sin_elevation = np.einsum("...i,...i->...", r_rel, zenith) / np.linalg.norm(
+        r_rel, axis=-1
+    )
+    return np.degrees(np.arcsin(sin_elevation))
+
+
+def check_in_view(r_sat, r_loc, zenith, min_elevation):
     """
     Checks if the elevation angle of the satellite with respect to the ground location is greater than the minimum elevation angle constraint.
 
     Args:
-        t (:obj:`Time`): Time object of skyfield.timelib module
-        satellite (:obj:`EarthSatellite`): Skyview EarthSatellite object from skyfield.sgp4lib module
-        topos (:obj:`GeographicPosition`): Geographic location on surface specified by latitude-longitude from skyfield.toposlib module
-        min_elevation (float): Minimum elevation angle (degrees) for ground to be in view of satellite, as calculated by compute_min_elevation
+        r_sat (:obj:`ndarray`): Position (km) of the satellite in the International Terrestrial Reference Frame (ITRF), as computed by propagate_itrf, or array of shape (N, 1, 3) for N satellites
+        r_loc (:obj:`ndarray`): Position (km) of the location in the ITRF, as computed by get_location_vectors, or array of shape (M, 3) for M locations
+        zenith (:obj:`ndarray`): Unit vector of the local zenith at the location, as computed by get_location_vectors, or array of shape (M, 3) for M locations
+        min_elevation (float or :obj:`ndarray`): Minimum elevation angle (degrees) for ground to be in view of satellite, as calculated by compute_min_elevation, or array of shape (N, 1) for N satellites
 
     Returns:
-        bool : isInView
-            True/False indicating visibility of ground location to satellite
+        bool or :obj:`ndarray` : isInView
+            True/False indicating visibility of each ground location to satellite
     """
-    isInView = False
-    elevationFromFire = get_elevation_angle(t, satellite, topos)
-    if elevationFromFire >= min_elevation:
-        isInView = True
-    return isInView
+    elevationFromFire = get_elevation_angle(r_sat, r_loc, zenith)
+    return elevationFromFire >= min_elevation
 
 
-def check_in_range(t, satellite, grounds):
+def check_in_range(r_sat, r_grounds, zenith_grounds, elev_angles, operational):
     """
     Checks if the satellite is in range of any of the operational ground stations.
 
     Args:
-        t (:obj:`Time`): Time object of skyfield.timelib module
-        satellite (:obj:`EarthSatellite`): Skyview EarthSatellite object from skyfield.sgp4lib module
-        grounds (:obj:`DataFrame`): Dataframe of ground station locations, minimum elevation angles for communication, and operational status (T/F)
+        r_sat (:obj:`ndarray`): Position (km) of the satellite in the International Terrestrial Reference Frame (ITRF), as computed by propagate_itrf, or array of shape (N, 3) for N satellites
+        r_grounds (:obj:`ndarray`): Array of shape (G, 3) with the ITRF position (km) of each ground station
+        zenith_grounds (:obj:`ndarray`): Array of shape (G, 3) with the local zenith unit vector of each ground station
+        elev_angles (:obj:`ndarray`): Array of shape (G,) with the minimum elevation angle (degrees) for communication with each ground station
+        operational (:obj:`ndarray`): Array of shape (G,) with the operational status (T/F) of each ground station
 
     Returns:
         bool, int :
             isInRange
-                True/False indicating visibility of satellite to any operational ground station
+                True/False indicating visibility of satellite to any operational ground station (array of shape (N,) for N satellites)
             groundId
-                groundId of the ground station currently in comm range (NOTE: If in range of two ground stations simultaneously, will return first groundId)
+                groundId of the ground station currently in comm range (NOTE: If in range of two ground stations simultaneously, will return first groundId; for N satellites, array of shape (N,) with -1 where not in range)
     """
-    isInRange = False
-    groundId = None
-    for k, ground in grounds.iterrows():
-        if ground.operational:
-            groundLatLon = wgs84.latlon(ground.latitude, ground.longitude)
-            satelliteElevation = get_elevation_angle(t, satellite, groundLatLon)
-            if satelliteElevation >= ground.elevAngle:
-                isInRange = True
-                groundId = k
-                break
-    return isInRange, groundId
+    # (N, G) visibility of every ground station from every satellite
+    inRange = operational & check_in_view(
+        np.expand_dims(r_sat, -2), r_grounds, zenith_grounds, elev_angles
+    )
+    isInRange = inRange.any(axis=-1)
+    if inRange.ndim == 1:
+        if not isInRange:
+            return False, None
+        return True, int(np.argmax(inRange))
+    if inRange.shape[-1] == 0:
+        return isInRange, np.full(isInRange.shape, -1)
+    return isInRange, np.where(isInRange, np.argmax(inRange, axis=-1), -1)
 
 # define an entity to manage satellite updates
 class Constellation(Entity):
@@ -170,13 +259,25 @@ class Constellation(Entity):
 
     Attributes:
         fires (list): List of fires with unique fireId (*int*), ignition (:obj:`datetime`), and latitude-longitude location (:obj:`GeographicPosition`) - *NOTE:* initialized as [ ]
-        grounds (:obj:`DataFrame`): Dataframe containing information about ground stations with unique groundId (*int*), latitude-longitude location (:obj:`GeographicPosition`), min_elevation (*float*) angle constraints, and operational status (*bool*) - *NOTE:* initialized as **None**
+        fire_itrf (:obj:`ndarray`): Array of shape (F, 3) with the ITRF position (km) of each fire, in the same order as **fires**
+        fire_zenith (:obj:`ndarray`): Array of shape (F, 3) with the local zenith unit vector of each fire, in the same order as **fires**
+        grounds (:obj:`DataFrame`): Dataframe containing information about ground stations with unique groundId (*int*), latitude-longitude location (:obj:`GeographicPosition`), min_elevation (*float*) angle constraints, and operational status (*bool*) - *NOTE:* initialized as **None**, built on access from the ground stations received since initialization
+        ground_itrf (:obj:`ndarray`): Array of shape (G, 3) with the ITRF position (km) of each ground station, in the same order as **grounds**
+        ground_zenith (:obj:`ndarray`): Array of shape (G, 3) with the local zenith unit vector of each ground station, in the same order as **grounds**
+        ground_elev_angles (:obj:`ndarray`): Array of shape (G,) with the minimum elevation angle (degrees) for communication with each ground station, in the same order as **grounds**
+        ground_operational (:obj:`ndarray`): Array of shape (G,) with the operational status (*bool*) of each ground station, in the same order as **grounds**
         satellites (list): List of :obj:`EarthSatellite` objects included in the constellation - *NOTE:* must be same length as **id**
-        detect (list): List of detected fires with unique fireId (*int*), detected :obj:`datetime`, and name (*str*) of detecting satellite - *NOTE:* initialized as [ ]
-        report (list): List of reported fires with unique fireId (*int*), reported :obj:`datetime`, name (*str*) of reporting satellite, and groundId (*int*) of ground station reported to - *NOTE:* initialized as [ ]
-        positions (list): List of current latitude-longitude-altitude locations (:obj:`GeographicPosition`) of each satellite in the constellation - *NOTE:* must be same length as **id**
-        next_positions (list): List of next latitude-longitude-altitude locations (:obj:`GeographicPosition`) of each satellite in the constellation - *NOTE:* must be same length as **id**
-        min_elevations_fire (list): List of *floats* indicating current elevation angle (degrees) constraint for visibility by each satellite - *NOTE:* must be same length as **id**, updates every time step
+        sat_array (:obj:`SatrecArray`): Array of SGP4 satellite records used to propagate all **satellites** in a single call
+        detected (:obj:`ndarray`): Array of shape (F, N) of *bools* indicating whether each fire has been detected by each satellite, in the same order as **fires** and **satellites**
+        first_detector (:obj:`ndarray`): Array of shape (F,) with the index of the first satellite to detect each fire (-1 if not yet detected)
+        first_detected (:obj:`ndarray`): Array of shape (F,) with the :obj:`datetime` of the first detection of each fire (**None** if not yet detected)
+        reported (:obj:`ndarray`): Array of shape (F, N) of *bools* indicating whether each fire has been reported by each satellite, in the same order as **fires** and **satellites**
+        first_reporter (:obj:`ndarray`): Array of shape (F,) with the index of the first satellite to report each fire (-1 if not yet reported)
+        first_reported (:obj:`ndarray`): Array of shape (F,) with the :obj:`datetime` of the first report of each fire (**None** if not yet reported)
+        first_reported_to (:obj:`ndarray`): Array of shape (F,) with the groundId (*int*) of the ground station each fire was first reported to (-1 if not yet reported)
+        positions (:obj:`ndarray`): Array of shape (N, 3) with the current latitude (degrees), longitude (degrees), and altitude (meters) of each satellite in the constellation - *NOTE:* must be same length as **id**
+        next_positions (:obj:`ndarray`): Array of shape (N, 3) with the next latitude (degrees), longitude (degrees), and altitude (meters) of each satellite in the constellation - *NOTE:* must be same length as **id**
+        min_elevations_fire (:obj:`ndarray`): Array of *floats* indicating current elevation angle (degrees) constraint for visibility by each satellite - *NOTE:* must be same length as **id**, updates when a satellite altitude drifts more than **MIN_ELEVATION_ALTITUDE_TOLERANCE** (meters) from the altitude last used to compute it
 
     """
 
@@ -184,6 +285,7 @@ class Constellation(Entity):
     PROPERTY_FIRE_REPORTED = "reported"
     PROPERTY_FIRE_DETECTED = "detected"
     PROPERTY_POSITION = "position"
+    MIN_ELEVATION_ALTITUDE_TOLERANCE = 500.0
 
     def __init__(self, cName, app, id, names, ES=None, tles=None):
         super().__init__(cName)
@@ -191,7 +293,12 @@ class Constellation(Entity):
         self.id = id
         self.names = names
         self.fires = []
-        self.grounds = None
+        self.fire_itrf = np.empty((0, 3))
+        self.fire_zenith = np.empty((0, 3))
+        self._ground_rows = None
+        # ground stations are registered on the broker's I/O thread and read on the simulator thread
+        self._ground_lock = threading.Lock()
+        self._reset_grounds()
         self.satellites = []
         if ES is not None:
             for satellite in ES:
@@ -201,16 +308,111 @@ class Constellation(Entity):
                 self.satellites.append(
                     EarthSatellite(tle[0], tle[1], self.names[i], self.ts)
                 )
-        self.detect = []
-        self.report = []
-        self.positions = self.next_positions = [None for satellite in self.satellites]
-        self.min_elevations_fire = [
-            compute_min_elevation(
-                wgs84.subpoint(satellite.at(satellite.epoch)).elevation.m,
-                FIELD_OF_REGARD[i],
+        self.sat_array = SatrecArray([satellite.model for satellite in self.satellites])
+        # propagation for the next tick is prefetched on a worker thread while observers publish;
+        # the worker lives from initialization until the simulation terminates
+        self._pool = None
+        self._prefetch = None
+        self._time_step = None
+        self.detected = np.empty((0, len(self.satellites)), dtype=bool)
+        self.first_detector = np.empty(0, dtype=int)
+        self.first_detected = np.empty(0, dtype=object)
+        self.reported = np.empty((0, len(self.satellites)), dtype=bool)
+        self.first_reporter = np.empty(0, dtype=int)
+        self.first_reported = np.empty(0, dtype=object)
+        self.first_reported_to = np.empty(0, dtype=int)
+        # fires first detected or reported during the current tick, to be notified on tock
+        self._new_detections = np.empty(0, dtype=bool)
+        self._new_reports = np.empty(0, dtype=bool)
+        self.positions = self.next_positions = np.full((len(self.satellites), 3), np.nan)
+        self._min_elevation_altitudes = np.array(
+            [
+                wgs84.subpoint(satellite.at(satellite.epoch)).elevation.m
+                for satellite in self.satellites
+            ]
+        )
+        self.min_elevations_fire = compute_min_elevation(
+            self._min_elevation_altitudes,
+            np.asarray(FIELD_OF_REGARD[: len(self.satellites)]),
+        )
+
+    @property
+    def grounds(self):
+        # ground stations are buffered as rows so each registration is O(1), and the DataFrame is only built when read
+        with self._ground_lock:
+            if self._grounds is None and self._ground_rows is not None:
+                self._grounds = pd.DataFrame(
+                    {
+                        "groundId": pd.Series(
+                            [row["groundId"] for row in self._ground_rows], dtype="int"
+                        ),
+                        "latitude": pd.Series(
+                            [row["latitude"] for row in self._ground_rows], dtype="float"
+                        ),
+                        "longitude": pd.Series(
+                            [row["longitude"] for row in self._ground_rows], dtype="float"
+                        ),
+                        "elevAngle": pd.Series(
+                            [row["elevAngle"] for row in self._ground_rows], dtype="float"
+                        ),
+                        "operational": pd.Series(
+                            [row["operational"] for row in self._ground_rows], dtype="bool"
+                        ),
+                    }
+                )
+        return self._grounds
+
+    def _reset_grounds(self):
+        self._grounds = None
+        # maps each groundId to its row in the buffered rows and ground arrays
+        self._ground_index = {}
+        self._ground_vectors = []
+        self._ground_arrays_stale = False
+        self.ground_itrf = np.empty((0, 3))
+        self.ground_zenith = np.empty((0, 3))
+        self.ground_elev_angles = np.empty(0)
+        self.ground_operational = np.empty(0, dtype=bool)
+
+    def _update_ground_arrays(self):
+        with self._ground_lock:
+            if not self._ground_arrays_stale:
+                return
+            self._ground_arrays_stale = False
+            self.ground_itrf = np.array(
+                [r_loc for r_loc, zenith in self._ground_vectors]
+            ).reshape(-1, 3)
+            self.ground_zenith = np.array(
+                [zenith for r_loc, zenith in self._ground_vectors]
+            ).reshape(-1, 3)
+            self.ground_elev_angles = np.array(
+                [row["elevAngle"] for row in self._ground_rows], dtype=float
+            )
+            self.ground_operational = np.array(
+                [row["operational"] for row in self._ground_rows], dtype=bool
             )
-            for i, satellite in enumerate(self.satellites)
-        ]
+
+    def in_range(self, r_sat):
+        """
+        Checks if a satellite is in range of any of the operational ground stations of the :obj:`Constellation`
+
+        Args:
+            r_sat (:obj:`ndarray`): Position (km) of the satellite in the International Terrestrial Reference Frame (ITRF), as computed by propagate_itrf, or array of shape (N, 3) for N satellites
+
+        Returns:
+            bool, int : isInRange, groundId as computed by check_in_range
+        """
+        self._update_ground_arrays()
+        return check_in_range(
+            r_sat,
+            self.ground_itrf,
+            self.ground_zenith,
+            self.ground_elev_angles,
+            self.ground_operational,
+        )
+
+    def _propagate(self, then):
+        r_sats = propagate_itrf(self.sat_array, then)
+        return r_sats, itrf_to_geodetic(r_sats)
 
     def initialize(self, init_time):
         """
@@ -220,19 +422,31 @@ class Constellation(Entity):
             init_time (:obj:`datetime`): Initial scenario time for simulating propagation of satellites
         """
         super().initialize(init_time)
-        self.grounds = pd.DataFrame(
-            {
-                "groundId": pd.Series([], dtype="int"),
-                "latitude": pd.Series([], dtype="float"),
-                "longitude": pd.Series([], dtype="float"),
-                "elevAngle": pd.Series([], dtype="float"),
-                "operational": pd.Series([], dtype="bool"),
-            }
+        with self._ground_lock:
+            self._ground_rows = []
+            self._reset_grounds()
+        self._shut_down_pool()
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self.positions = self.next_positions = itrf_to_geodetic(
+            propagate_itrf(self.sat_array, self.ts.from_datetime(init_time))
         )
-        self.positions = self.next_positions = [
-            wgs84.subpoint(satellite.at(self.ts.from_datetime(init_time)))
-            for satellite in self.satellites
-        ]
+
+    def _shut_down_pool(self):
+        # a pending prefetch is abandoned without waiting for it
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._prefetch = None
+
+    def on_change(self, source, property_name, old_value, new_value):
+        """
+        *Standard on_change callback function format inherited from Observer object class in NOS-T tools library*
+
+        Shuts down the propagation worker when the simulation switches to **TERMINATED** mode.
+
+        """
+        if property_name == Simulator.PROPERTY_MODE and new_value == Mode.TERMINATED:
+            self._shut_down_pool()
 
     def tick(self, time_step):
         """
@@ -242,74 +456,94 @@ class Constellation(Entity):
             time_step (:obj:`timedelta`): Duration between current and next simulation scenario time
         """
         super().tick(time_step)
-        self.next_positions = [
-            wgs84.subpoint(
-                satellite.at(self.ts.from_datetime(self.get_time() + time_step))
+        self._time_step = time_step
+        then_datetime = self.get_time() + time_step
+        if self._prefetch is not None and self._prefetch[0] == then_datetime:
+            r_sats, self.next_positions = self._prefetch[1].result()
+        else:
+            r_sats, self.next_positions = self._propagate(
+                self.ts.from_datetime(then_datetime)
             )
-            for satellite in self.satellites
-        ]
-        for i, satellite in enumerate(self.satellites):
-            then = self.ts.from_datetime(self.get_time() + time_step)
-            self.min_elevations_fire[i] = compute_min_elevation(
-                float(self.next_positions[i].elevation.m), FIELD_OF_REGARD[i]
+        self._prefetch = None
+        # LEO altitudes drift slowly, so min elevations are only recomputed after a material change
+        altitudes = self.next_positions[:, 2]
+        changed = np.flatnonzero(
+            np.abs(altitudes - self._min_elevation_altitudes)
+            > self.MIN_ELEVATION_ALTITUDE_TOLERANCE
+        )
+        if changed.size:
+            self.min_elevations_fire[changed] = compute_min_elevation(
+                altitudes[changed], np.asarray(FIELD_OF_REGARD)[changed]
             )
-            for j, fire in enumerate(self.fires):
-                if self.detect[j][self.names[i]] is None:
-                    topos = wgs84.latlon(fire["latitude"], fire["longitude"])
-                    isInView = check_in_view(
-                        then, satellite, topos, self.min_elevations_fire[i]
-                    )
-                    if isInView:
-                        self.detect[j][self.names[i]] = (
-                            self.get_time() + time_step
-                        )  # TODO could use event times
-                        if self.detect[j]["firstDetector"] is None:
-                            self.detect[j]["firstDetect"] = True
-                            self.detect[j]["firstDetector"] = self.names[i]
-                if (self.detect[j][self.names[i]] is not None) and (
-                    self.report[j][self.names[i]] is None
-                ):
-                    isInRange, groundId = check_in_range(then, satellite, self.grounds)
-                    if isInRange:
-                        self.report[j][self.names[i]] = self.get_time() + time_step
-                        if self.report[j]["firstReporter"] is None:
-                            self.report[j]["firstReport"] = True
-                            self.report[j]["firstReporter"] = self.names[i]
-                            self.report[j]["firstReportedTo"] = groundId
+            self._min_elevation_altitudes[changed] = altitudes[changed]
+        detectTime = self.get_time() + time_step  # TODO could use event times
+        # a single (N, A) visibility matrix of all satellites over the fires not yet detected by every satellite
+        active = np.flatnonzero(~self.detected.all(axis=1))
+        if active.size:
+            isInView = check_in_view(
+                r_sats[:, np.newaxis, :],
+                self.fire_itrf[active],
+                self.fire_zenith[active],
+                self.min_elevations_fire[:, np.newaxis],
+            ).T
+            newlyDetected = isInView & ~self.detected[active]
+            self.detected[active] |= isInView
+            # when several satellites detect a fire in the same tick, the first one in the constellation is credited
+            firstDetect = newlyDetected.any(axis=1) & (self.first_detector[active] < 0)
+            firstDetected = active[firstDetect]
+            self.first_detector[firstDetected] = np.argmax(
+                newlyDetected[firstDetect], axis=1
+            )
+            self.first_detected[firstDetected] = detectTime
+            self._new_detections[firstDetected] = True
+        # likewise only fires detected but not yet reported by a satellite need a range check
+        pending = self.detected & ~self.reported
+        if pending.any():
+            isInRange, groundIds = self.in_range(r_sats)
+            newlyReported = pending & isInRange
+            self.reported |= newlyReported
+            firstReport = newlyReported.any(axis=1) & (self.first_reporter < 0)
+            reporters = np.argmax(newlyReported[firstReport], axis=1)
+            self.first_reporter[firstReport] = reporters
+            self.first_reported[firstReport] = detectTime
+            self.first_reported_to[firstReport] = groundIds[reporters]
+            self._new_reports |= firstReport
 
     def tock(self):
         """
         Commits the next :obj:`Constellation` state and advances simulation scenario time
 
         """
+        # assumes the next tick uses the same time step, otherwise tick propagates synchronously
+        prefetch_time = self._next_time + self._time_step
+        self._prefetch = (
+            prefetch_time,
+            self._pool.submit(self._propagate, self.ts.from_datetime(prefetch_time)),
+        )
         self.positions = self.next_positions
-        for i, newly_detected_fire in enumerate(self.detect):
-            if newly_detected_fire["firstDetect"]:
-                detector = newly_detected_fire["firstDetector"]
-                self.notify_observers(
-                    self.PROPERTY_FIRE_DETECTED,
-                    None,
-                    {
-                        "fireId": newly_detected_fire["fireId"],
-                        "detected": newly_detected_fire[detector],
-                        "detected_by": detector,
-                    },
-                )
-                self.detect[i]["firstDetect"] = False
-        for i, newly_reported_fire in enumerate(self.report):
-            if newly_reported_fire["firstReport"]:
-                reporter = newly_reported_fire["firstReporter"]
-                self.notify_observers(
-                    self.PROPERTY_FIRE_REPORTED,
-                    None,
-                    {
-                        "fireId": newly_reported_fire["fireId"],
-                        "reported": newly_reported_fire[reporter],
-                        "reported_by": reporter,
-                        "reported_to": newly_reported_fire["firstReportedTo"],
-                    },
-                )
-            self.report[i]["firstReport"] = False
+        for j in np.flatnonzero(self._new_detections):
+            self.notify_observers(
+                self.PROPERTY_FIRE_DETECTED,
+                None,
+                {
+                    "fireId": self.fires[j]["fireId"],
+                    "detected": self.first_detected[j],
+                    "detected_by": self.names[self.first_detector[j]],
+                },
+            )
+        self._new_detections[:] = False
+        for j in np.flatnonzero(self._new_reports):
+            self.notify_observers(
+                self.PROPERTY_FIRE_REPORTED,
+                None,
+                {
+                    "fireId": self.fires[j]["fireId"],
+                    "reported": self.first_reported[j],
+                    "reported_by": self.names[self.first_reporter[j]],
+                    "reported_to": self.first_reported_to[j],
+                },
+            )
+        self._new_reports[:] = False
         super().tock()
 
 
@@ -334,29 +568,27 @@ class Constellation(Entity):
                 "longitude": started.longitude,
             },
         )
-        satelliteDictionary = dict.fromkeys(
-            self.names
-        )  # Creates dictionary where keys are satellite names and values are defaulted to NoneType
-        satelliteDictionary[
-            "fireId"
-        ] = (
-            started.fireId
-        )  # Adds fireId to dictionary, which will coordinate with position of dictionary in list of dictionaries
-        detectDictionary = copy.deepcopy(satelliteDictionary)
-        detectDictionary["firstDetect"] = False
-        detectDictionary["firstDetector"] = None
-        self.detect.append(detectDictionary)
-        reportDictionary = copy.deepcopy(satelliteDictionary)
-        reportDictionary["firstReport"] = False
-        reportDictionary["firstReporter"] = None
-        reportDictionary["firstReportedTo"] = None
-        self.report.append(reportDictionary)
+        # fire locations are fixed, so ITRF vectors are computed once rather than every tick
+        r_loc, zenith = get_location_vectors(started.latitude, started.longitude)
+        self.fire_itrf = np.vstack((self.fire_itrf, r_loc))
+        self.fire_zenith = np.vstack((self.fire_zenith, zenith))
+        # adds a row for the new fire, which will coordinate with position of fire in list of fires
+        noSatellites = np.zeros((1, len(self.satellites)), dtype=bool)
+        self.detected = np.vstack((self.detected, noSatellites))
+        self.first_detector = np.append(self.first_detector, -1)
+        self.first_detected = np.append(self.first_detected, None)
+        self.reported = np.vstack((self.reported, noSatellites))
+        self.first_reporter = np.append(self.first_reporter, -1)
+        self.first_reported = np.append(self.first_reported, None)
+        self.first_reported_to = np.append(self.first_reported_to, -1)
+        self._new_detections = np.append(self._new_detections, False)
+        self._new_reports = np.append(self._new_reports, False)
         # ch.connection.close()
         # ch.basic_ack(delivery_tag=method.delivery_tag)
 
     def on_ground(self, ch, method, properties, body): #client, userdata, message):
         """
-        Callback function appends a dictionary of information for a new ground station to grounds :obj:`list` when message detected on the *PREFIX/ground/location* topic. Ground station information is published at beginning of simulation, and the :obj:`list` is converted to a :obj:`DataFrame` when the Constellation is initialized.
+        Callback function appends a dictionary of information for a new ground station, or replaces that of a known groundId, in the grounds :obj:`list` when message detected on the *PREFIX/ground/location* topic. Ground station information is published at beginning of simulation, and the :obj:`list` is converted to a :obj:`DataFrame` when **grounds** is read.
 
         Args:
             client (:obj:`MQTT Client`): Client that connects application to the event broker using the MQTT protocol. Includes user credentials, tls certificates, and host server-port information.
@@ -368,34 +600,29 @@ class Constellation(Entity):
 
         location = GroundLocation.parse_raw(body) #message.payload)
 
-        if location.groundId in self.grounds.groundId:
-            self.grounds[
-                self.grounds.groundId == location.groundId
-            ].latitude = location.latitude
-            self.grounds[
-                self.grounds.groundId == location.groundId
-            ].longitude = location.longitude
-            self.grounds[
-                self.grounds.groundId == location.groundId
-            ].elevAngle = location.elevAngle
-            self.grounds[
-                self.grounds.groundId == location.groundId
-            ].operational = location.operational
+        row = {
+            "groundId": location.groundId,
+            "latitude": location.latitude,
+            "longitude": location.longitude,
+            "elevAngle": location.elevAngle,
+            "operational": location.operational,
+        }
+        # ground stations are fixed, so ITRF vectors are computed once per message rather than every tick
+        vectors = get_location_vectors(location.latitude, location.longitude)
+        with self._ground_lock:
+            updated = location.groundId in self._ground_index
+            if updated:
+                idx = self._ground_index[location.groundId]
+                self._ground_rows[idx] = row
+                self._ground_vectors[idx] = vectors
+            else:
+                self._ground_index[location.groundId] = len(self._ground_rows)
+                self._ground_rows.append(row)
+                self._ground_vectors.append(vectors)
+            self._grounds = None
+            self._ground_arrays_stale = True
+        if updated:
             print(f"Station {location.groundId} updated at time {self.get_time()}.")
-        else:
-            location = {
-                    "groundId": location.groundId,
-                    "latitude": location.latitude,
-                    "longitude": location.longitude,
-                    "elevAngle": location.elevAngle,
-                    "operational": location.operational,
-                }
-            
-            # Create a DataFrame from the location dictionary
-            new_data = pd.DataFrame([location])
-
-            # Concatenate the new data with the existing DataFrame
-            self.grounds = pd.concat([self.grounds, new_data], ignore_index=True)
 
 # define a publisher to report satellite status
 class PositionPublisher(WallclockTimeIntervalPublisher):
@@ -417,9 +644,9 @@ class PositionPublisher(WallclockTimeIntervalPublisher):
     ):
         super().__init__(app, time_status_step, time_status_init)
         self.constellation = constellation
-        self.isInRange = [
-            False for i, satellite in enumerate(self.constellation.satellites)
-        ]
+        # wallclock status step scaled to the scenario duration ahead of which positions are published
+        self._scenario_step = SCALE * self.time_status_step
+        self.isInRange = np.zeros(len(self.constellation.satellites), dtype=bool)
 
     def publish_message(self):
         """
@@ -428,31 +655,30 @@ class PositionPublisher(WallclockTimeIntervalPublisher):
         This method sends a :obj:`SatelliteStatus` message to the *PREFIX/constellation/location* topic for each satellite in the constellation (:obj:`Constellation`).
 
         """
+        time = self.constellation.get_time()
+        # a single Time and propagation call serves every satellite
+        next_time = self.constellation.ts.from_datetime(time + self._scenario_step)
+        r_sats = propagate_itrf(self.constellation.sat_array, next_time)
+        subpoints = itrf_to_geodetic(r_sats)
+        sensorRadii = compute_sensor_radius(
+            subpoints[:, 2], self.constellation.min_elevations_fire
+        )
+        self.isInRange[:], groundIds = self.constellation.in_range(r_sats)
         for i, satellite in enumerate(self.constellation.satellites):
-            next_time = constellation.ts.from_datetime(
-                constellation.get_time() + 60 * self.time_status_step
-            )
-            satSpaceTime = satellite.at(next_time)
-            subpoint = wgs84.subpoint(satSpaceTime)
-            sensorRadius = compute_sensor_radius(
-                subpoint.elevation.m, constellation.min_elevations_fire[i]
-            )
-            self.isInRange[i], groundId = check_in_range(
-                next_time, satellite, constellation.grounds
-            )
+            latitude, longitude, altitude = subpoints[i]
             self.app.send_message(
                 self.app.app_name,
                 "location",
                 SatelliteStatus(
                     id=i,
                     name=satellite.name,
-                    latitude=subpoint.latitude.degrees,
-                    longitude=subpoint.longitude.degrees,
-                    altitude=subpoint.elevation.m,
-                    radius=sensorRadius,
+                    latitude=latitude,
+                    longitude=longitude,
+                    altitude=altitude,
+                    radius=sensorRadii[i],
                     commRange=self.isInRange[i],
-                    time=constellation.get_time(),
-                ).json(),
+                    time=time,
+                ).model_dump_json(),
             )
 
 
@@ -482,7 +708,7 @@ class FireDetectedObserver(Observer):
                     fireId=new_value["fireId"],
                     detected=new_value["detected"],
                     detected_by=new_value["detected_by"],
-                ).json(),
+                ).model_dump_json(),
             )
 
 
@@ -515,7 +741,7 @@ class FireReportedObserver(Observer):
                     reported=new_value["reported"],
                     reported_by=new_value["reported_by"],
                     reported_to=new_value["reported_to"],
-                ).json(),
+                ).model_dump_json(),
             )
 
 if __name__ == "__main__":
@@ -567,6 +793,9 @@ if __name__ == "__main__":
     # add the Constellation entity to the application's simulator
     app.simulator.add_entity(constellation)
 
+    # shut down the Constellation's propagation worker when the simulation terminates
+    app.simulator.add_observer(constellation)
+
     # add a shutdown observer to shut down after a single test case
     app.simulator.add_observer(ShutDownObserver(app))
 
@@ -1,7 +1,12 @@
 from datetime import datetime, timezone, timedelta
 from dotenv import dotenv_values
+from functools import lru_cache
+import math
 from skyfield.api import load, wgs84, EarthSatellite
-from skyfield.framelib import itrs
+from skyfield.functions import rot_z
+from skyfield.sgp4lib import theta_GMST1982
+from sgp4.api import SatrecArray
+from sgp4.conveniences import jday_datetime
 import numpy as np
 import logging
 import pandas as pd
@@ -26,6 +31,10 @@ from constellation_config_files.config import PREFIX, NAME, SCALE, TLES, FIELD_O
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
+EARTH_EQUATORIAL_RADIUS = 6378137.0  # meters
+EARTH_POLAR_RADIUS = 6356752.314245179  # meters
+EARTH_MEAN_RADIUS = (2 * EARTH_EQUATORIAL_RADIUS + EARTH_POLAR_RADIUS) / 3  # meters
+
 def get_elevation_angle(t, sat, loc):
     """
     Returns the elevation angle (degrees) of satellite with respect to the topocentric horizon.
@@ -49,26 +58,91 @@ def compute_sensor_radius(altitude, min_elevation):
     """
     Computes the sensor radius for a satellite at current altitude given minimum elevation constraints.
 
+    Scalar results are memoized on the altitude rounded to the meter and the minimum elevation rounded to a hundredth of a degree; arrays are evaluated in a single vectorized pass.
+
     Args:
-        altitude (float): Altitude (meters) above surface of the observation
-        min_elevation (float): Minimum angle (degrees) with horizon for visibility
+        altitude (float or :obj:`ndarray`): Altitude (meters) above surface of the observation
+        min_elevation (float or :obj:`ndarray`): Minimum angle (degrees) with horizon for visibility
 
     Returns:
-        float : sensor_radius
+        float or :obj:`ndarray` : sensor_radius
             The radius (meters) of the nadir pointing sensors circular view of observation
     """
-    earth_equatorial_radius = 6378137.0
-    earth_polar_radius = 6356752.314245179
-    earth_mean_radius = (2 * earth_equatorial_radius + earth_polar_radius) / 3
+    if not isinstance(altitude, np.ndarray) and not isinstance(min_elevation, np.ndarray):
+        return _compute_sensor_radius(round(altitude), round(min_elevation * 100))
+    sin_rho = EARTH_MEAN_RADIUS / (EARTH_MEAN_RADIUS + altitude)
+    eta = np.degrees(np.arcsin(np.cos(np.radians(min_elevation)) * sin_rho))
+    sw_HalfAngle = 90 - eta - min_elevation
+    return np.where(
+        sw_HalfAngle < 0.0, 0.0, EARTH_MEAN_RADIUS * np.radians(sw_HalfAngle)
+    )
+
+@lru_cache(maxsize=1024)
+def _compute_sensor_radius(altitude, min_elevation_centideg):
+    min_elevation = min_elevation_centideg / 100
     # rho is the angular radius of the earth viewed by the satellite
-    sin_rho = earth_mean_radius / (earth_mean_radius + altitude)
+    sin_rho = EARTH_MEAN_RADIUS / (EARTH_MEAN_RADIUS + altitude)
     # eta is the nadir angle between the sub-satellite direction and the target location on the surface
-    eta = np.degrees(np.arcsin(np.cos(np.radians(min_elevation)) * sin_rho))
-    # calculate swath width half angle from trigonometry
+    if min_elevation == 0:
+        # satellites are currently modeled without an elevation constraint, where cos(0) = 1
+        eta = math.degrees(math.asin(sin_rho))
+    else:
+        eta = math.degrees(math.asin(math.cos(math.radians(min_elevation)) * sin_rho))
+    # calculate swath width half angle from trigonometry, clamped at zero
     sw_HalfAngle = 90 - eta - min_elevation
-    if sw_HalfAngle < 0.0:
-        return 0.0
-    return earth_mean_radius * np.radians(sw_HalfAngle)
+    return max(0.0, EARTH_MEAN_RADIUS * math.radians(sw_HalfAngle))
+
+def propagate_itrf(satellites, t):
+    """
+    Propagates all satellites to a common time in a single SGP4 call and returns their states in the International Terrestrial Reference Frame (ITRF).
+
+    Args:
+        satellites (:obj:`SatrecArray`): Array of SGP4 satellite records from the sgp4.api module
+        t (:obj:`Time`): Time object of skyfield.timelib module
+
+    Returns:
+        :obj:`ndarray`, :obj:`ndarray` :
+            r_itrf
+                Array of shape (N, 3) with the position (km) of each satellite in the ITRF
+            v_itrf
+                Array of shape (N, 3) with the velocity (km/s) of each satellite in the ITRF
+    """
+    jd, fr = jday_datetime(t.utc_datetime())
+    e, r, v = satellites.sgp4(np.array([jd]), np.array([fr]))
+    # TEME and ITRF differ by a rotation about the z-axis through Greenwich sidereal time (polar motion neglected)
+    theta, theta_dot = theta_GMST1982(t.whole, t.ut1_fraction)
+    rotation = rot_z(-theta).T
+    # NOTE: SatrecArray returns arrays of shape (N, 1, 3) for a single time
+    r_itrf = r[:, 0, :].dot(rotation)
+    # velocity relative to the rotating Earth (theta_dot is in radians per day)
+    v_itrf = v[:, 0, :].dot(rotation) - np.cross([0.0, 0.0, theta_dot / 86400.0], r_itrf)
+    return r_itrf, v_itrf
+
+def itrf_to_geodetic(r_itrf):
+    """
+    Converts positions in the International Terrestrial Reference Frame (ITRF) to geodetic coordinates on the WGS84 ellipsoid.
+
+    Args:
+        r_itrf (:obj:`ndarray`): Array of shape (N, 3) with positions (km) in the ITRF, as computed by propagate_itrf
+
+    Returns:
+        :obj:`ndarray` : positions
+            Array of shape (N, 3) with the latitude (degrees), longitude (degrees), and altitude (meters) of each position
+    """
+    x, y, z = r_itrf.T
+    a = wgs84.radius.km
+    e2 = wgs84._e2
+    R = np.hypot(x, y)
+    lat = np.arctan2(z, R)
+    # fixed-point iteration on the geodetic latitude, converged well below a millimeter after three steps for LEO
+    for iteration in range(3):
+        e2_sin_lat = e2 * np.sin(lat)
+        aC = a / np.sqrt(1.0 - e2_sin_lat * np.sin(lat))
+        hyp = z + aC * e2_sin_lat
+        lat = np.arctan2(hyp, R)
+    lon = np.arctan2(y, x)
+    alt = (np.hypot(hyp, R) - aC) * 1000
+    return np.column_stack((np.degrees(lat), np.degrees(lon), alt))
 
 class Constellation(Entity):
     ts = load.timescale()
@@ -88,14 +162,14 @@ class Constellation(Entity):
                 self.satellites.append(
                     EarthSatellite(tle[0], tle[1], self.names[i], self.ts)
                 )
-        self.positions = self.next_positions = [None for satellite in self.satellites]
+        self.sat_array = SatrecArray([satellite.model for satellite in self.satellites])
+        # geodetic latitude (deg), longitude (deg), and altitude (m) of each satellite
+        self.positions = self.next_positions = np.full((len(self.satellites), 3), np.nan)
 
     def initialize(self, init_time):
         super().initialize(init_time)
-        self.positions = self.next_positions = [
-            wgs84.subpoint(satellite.at(self.ts.from_datetime(init_time)))
-            for satellite in self.satellites
-        ]
+        r_itrf, v_itrf = propagate_itrf(self.sat_array, self.ts.from_datetime(init_time))
+        self.positions = self.next_positions = itrf_to_geodetic(r_itrf)
         
 # define a publisher to report satellite status
 class PositionPublisher(WallclockTimeIntervalPublisher):
@@ -127,9 +201,27 @@ class PositionPublisher(WallclockTimeIntervalPublisher):
         self.top_right = top_right
         self.bottom_left = bottom_left
         self.bottom_right = bottom_right
+        # per-satellite operational state (a function of the scenario minute) and swath width (m), resolved once by name
+        state_functions = {
+            'CAPELLA-14 (ACADIA-4)': lambda minute: minute < 5,
+            'GCOM-W1 (SHIZUKU)': lambda minute: True,
+        }
+        swath_data = {
+            'CAPELLA-14 (ACADIA-4)': 5000, #30000, # Swath value in m 
+            'GCOM-W1 (SHIZUKU)': 1450000 # Swath value in m
+            }
+        self._state_functions = [
+            state_functions.get(satellite.name, lambda minute: True)
+            for satellite in self.constellation.satellites
+        ]
+        self._swath = np.array(
+            [swath_data.get(satellite.name, 0) for satellite in self.constellation.satellites]
+        )
 
         if self.time_status_init is None:
             self.time_status_init = self.constellation.ts.now().utc_datetime()
+        # reference time for the satellite state schedule, normalized to UTC once
+        self._t0 = self.time_status_init.astimezone(timezone.utc)
     
     def get_extents(self, dataset, variable):
         # Extract the GeoTransform attribute
@@ -244,59 +336,59 @@ class PositionPublisher(WallclockTimeIntervalPublisher):
         This method sends a :obj:`SatelliteStatus` message to the *PREFIX/constellation/location* topic for each satellite in the constellation (:obj:`Constellation`).
 
         """
-        current_time = constellation.get_time()
-        elapsed_seconds = (current_time - self.time_status_init).total_seconds()
+        self.app.send_messages(
+            self.app.app_name,
+            "location",
+            self._build_status(self.constellation.get_time()),
+        )
+
+    def _build_status(self, current_time):
+        """
+        Propagates the constellation to the scenario time snapshot and serializes one :obj:`SatelliteStatus` message per satellite.
+
+        Args:
+            current_time (:obj:`datetime`): Scenario time of the update
+
+        Returns:
+            list: JSON payloads, one per satellite
+        """
+        elapsed_seconds = (current_time - self._t0).total_seconds()
         current_minute = (elapsed_seconds // 60) % 100
-        
-        swath_data = {
-            'CAPELLA-14 (ACADIA-4)': 5000, #30000, # Swath value in m 
-            'GCOM-W1 (SHIZUKU)': 1450000 # Swath value in m
-            }
-        
-        for i, satellite in enumerate(self.constellation.satellites):
-            next_time = constellation.ts.from_datetime(
-                constellation.get_time() + 60 * self.time_status_step
-            )
-            
-            # Get the subpoint of the satellite
-            satSpaceTime = satellite.at(next_time)
 
+        next_time = self.constellation.ts.from_datetime(
+            current_time + 60 * self.time_status_step
+        )
+        # propagate the whole constellation in one call
+        positions, velocities = propagate_itrf(self.constellation.sat_array, next_time)
+        subpoints = itrf_to_geodetic(positions)
+        # angular width of every satellite's sensor in one vectorized pass
+        sensor_radii = compute_sensor_radius(subpoints[:, 2], 0)
+
+        payloads = []
+        for i, satellite in enumerate(self.constellation.satellites):
             # Determine if the satellite is operational
-            if satellite.name=='CAPELLA-14 (ACADIA-4)':
-                state = current_minute < 5
-            elif satellite.name=='GCOM-W1 (SHIZUKU)':
-                state = True
+            state = self._state_functions[i](current_minute)
 
-            # Get the cartesian position of the satellite in International Terrestrial Reference System (ITRS)
-            position, velocity = satSpaceTime.frame_xyz_and_velocity(itrs)
-            # Origin of the coordinate system is at the center of mass of the Earth, and the axes are fixed relative to the Earth
-            x, y, z = position.m
-            velocity_x, velocity_y, velocity_z = velocity.km_per_s
+            # Origin of the ITRS coordinate system is at the center of mass of the Earth, and the axes are fixed relative to the Earth
+            x, y, z = positions[i] * 1000
+            velocity_x, velocity_y, velocity_z = velocities[i]
 
             # Get the geographic position of the satellite
-            lat, lon = wgs84.latlon_of(satSpaceTime)
-            altitude = wgs84.height_of(satSpaceTime)
+            lat, lon, altitude = subpoints[i]
 
-            #Get the angular width of the satellite
-            sensorRadius = compute_sensor_radius(
-                altitude.m, # subpoint.elevation.m, 
-                0
-            )
-
-            self.app.send_message(
-                self.app.app_name,
-                "location",
-                SatelliteStatus(
+            payloads.append(
+                # values are computed here from the propagated states, so validation is skipped
+                SatelliteStatus.model_construct(
                     id=i,
                     name=satellite.name,
-                    latitude=lat.degrees,
-                    longitude=lon.degrees,
-                    altitude=altitude.m,
-                    radius=sensorRadius,
+                    latitude=lat,
+                    longitude=lon,
+                    altitude=altitude,
+                    radius=sensor_radii[i],
                     velocity=[velocity_x, velocity_y, velocity_z],
                     state=state,
-                    swath=swath_data.get(satellite.name, 0),
-                    time=constellation.get_time(),
+                    swath=float(self._swath[i]),
+                    time=current_time,
                     ecef=[x, y, z],
                     snow_layer=self.snow_layer,
                     resolution_layer=self.resolution_layer,
@@ -306,8 +398,9 @@ class PositionPublisher(WallclockTimeIntervalPublisher):
                     top_right=self.top_right,
                     bottom_left=self.bottom_left,
                     bottom_right=self.bottom_right
-                ).json(),
+                ).model_dump_json()
             )
+        return payloads
 
 # Function to read and encode the layers
 def read_and_encode_layers(position_publisher):
@@ -374,7 +467,12 @@ if __name__ == "__main__":
     app = ManagedApplication(NAME)
 
     activesats_url = "https://celestrak.org/NORAD/elements/gp.php?GROUP=active&FORMAT=tle"
-    activesats = load.tle_file(activesats_url, reload=False, filename='./active.txt') #True
+    # reuse the local copy, downloading again only when it is missing or more than six hours old
+    activesats = load.tle_file(
+        activesats_url,
+        reload=not load.exists('active.txt') or load.days_old('active.txt') > 0.25,
+        filename='./active.txt'
+    )
 
     by_name = {sat.name: sat for sat in activesats}
     names = ['CAPELLA-14 (ACADIA-4)', 'GCOM-W1 (SHIZUKU)']
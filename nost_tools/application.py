@@ -4,10 +4,12 @@ Provides a base application that publishes messages from a simulator to a broker
 
 import functools
 import logging
+import socket
 import ssl
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Callable
 
@@ -73,17 +75,42 @@ class Application:
         self._consuming = False
         self._should_stop = threading.Event()
         self._closing = False
+        self._wallclock_offset_expiry = None
+        self._ssl_context = None
         # Queues
         self.channel_configs = []
         self.unique_exchanges = {}
         self.declared_queues = set()
         self.declared_exchanges = set()
+        # (exchange, queue, routing key) bindings made on the current channel
+        self.declared_bindings = set()
+        self._publish_routing_keys = {}
+        # Publisher confirms
+        self._publish_confirms = threading.Condition()
+        self._publish_sequence = 0
+        # routing key, payload, and number of retries of each message awaiting a confirm, by delivery tag
+        self._unconfirmed_publishes = {}
+        # messages rejected by the broker, republished by the next sender
+        self._nacked_publishes = []
+        self.max_unconfirmed_publishes = 10000
+        self.max_publish_retries = 3
+        self._message_properties = None
         self.predefined_exchanges_queues = False
         self._callbacks_per_topic = {}
+        # callbacks resolved per received routing key, tagged with the generation they were resolved in
+        self._callbacks_per_routing_key = {}
+        self._callbacks_generation = 0
         # Token
         self.refresh_token = None
+        self._keycloak_openid = None
+        self._access_token = None
+        self._token_expiry = None
+        self._token_lifetime = None
+        self._token_lock = threading.Lock()
         self._token_refresh_thread = None
         self.token_refresh_interval = None
+        # lower bound in seconds between refresh attempts, including retries after a failure
+        self.min_token_refresh_wait = 5
 
     def ready(self) -> None:
         """
@@ -109,27 +136,47 @@ class Application:
         the access token is refreshed using the refresh token. Otherwise, the access token is obtained
         using the username and password provided in the configuration.
 
+        Requests are serialized, so the stored access and refresh tokens always come from the same response.
+
+        Args:
+            refresh_token (str): refresh token (optional)
+        """
+        with self._token_lock:
+            token = self._request_access_token(refresh_token)
+            self._access_token, self.refresh_token = (
+                token["access_token"],
+                token["refresh_token"],
+            )
+            # lifetime and monotonic deadline of the access token, used to schedule the next refresh
+            self._token_lifetime = token.get("expires_in")
+            self._token_expiry = (
+                time.monotonic() + self._token_lifetime
+                if self._token_lifetime is not None
+                else None
+            )
+            return self._access_token, self.refresh_token
+
+    def _request_access_token(self, refresh_token=None):
+        """
+        Requests a new access token and refresh token from Keycloak.
+
         Args:
             refresh_token (str): refresh token (optional)
+
+        Returns:
+            dict: Keycloak token response
         """
         logger.debug(
             "Acquiring access token."
             if not refresh_token
             else "Refreshing access token."
         )
-        keycloak_openid = KeycloakOpenID(
-            server_url=f"{'http' if 'localhost' in self.config.rc.server_configuration.servers.keycloak.host or '127.0.0.1' in self.config.rc.server_configuration.servers.keycloak.host else 'https'}://{self.config.rc.server_configuration.servers.keycloak.host}:{self.config.rc.server_configuration.servers.keycloak.port}",
-            client_id=self.config.rc.credentials.client_id,
-            realm_name=self.config.rc.server_configuration.servers.keycloak.realm,
-            client_secret_key=self.config.rc.credentials.client_secret_key,
-            verify=False,
-        )
         try:
             if refresh_token:
-                token = keycloak_openid.refresh_token(refresh_token)
+                token = self._keycloak_openid.refresh_token(refresh_token)
             else:
                 try:
-                    token = keycloak_openid.token(
+                    token = self._keycloak_openid.token(
                         grant_type="password",
                         username=self.config.rc.credentials.username,
                         password=self.config.rc.credentials.password,
@@ -137,7 +184,7 @@ class Application:
                 except KeycloakAuthenticationError as e:
                     logger.error(f"Authentication error without OTP: {e}")
                     otp = input("Enter OTP: ")
-                    token = keycloak_openid.token(
+                    token = self._keycloak_openid.token(
                         grant_type="password",
                         username=self.config.rc.credentials.username,
                         password=self.config.rc.credentials.password,
@@ -149,7 +196,7 @@ class Application:
                     if not refresh_token
                     else "Refreshing access token successfully completed."
                 )
-                return token["access_token"], token["refresh_token"]
+                return token
             else:
                 raise Exception("Error: The request was unsuccessful.")
         except Exception as e:
@@ -158,7 +205,8 @@ class Application:
 
     def start_token_refresh_thread(self):
         """
-        Starts a background thread to refresh the access token periodically.
+        Starts a background thread to refresh the access token periodically. The token is refreshed
+        every token refresh interval, or sooner if the access token would otherwise expire first.
 
         Args:
             config (:obj:`ConnectionConfig`): connection configuration
@@ -166,12 +214,9 @@ class Application:
         logger.debug("Starting refresh token thread.")
 
         def refresh_token_periodically():
-            while not self._should_stop.wait(timeout=self.token_refresh_interval):
+            while not self._should_stop.wait(timeout=self._next_token_refresh()):
                 try:
-                    access_token, refresh_token = self.new_access_token(
-                        self.refresh_token
-                    )
-                    self.refresh_token = refresh_token
+                    access_token, _ = self.new_access_token(self.refresh_token)
                     self.update_connection_credentials(access_token)
                 except Exception as e:
                     logger.error(f"Failed to refresh access token: {e}")
@@ -180,6 +225,27 @@ class Application:
         self._token_refresh_thread.start()
         logger.debug("Starting refresh token thread successfully completed.")
 
+    def _next_token_refresh(self):
+        """
+        Computes the number of seconds to wait before the next token refresh. The token is
+        refreshed once 80% of its lifetime has elapsed, but never sooner than
+        ``min_token_refresh_wait`` seconds, so a failed refresh or a short-lived token does
+        not turn the refresh thread into a busy loop.
+
+        Returns:
+            float: seconds until the next refresh
+        """
+        if self._token_expiry is None:
+            return self.token_refresh_interval
+        margin = 0.2 * self._token_lifetime
+        return max(
+            self.min_token_refresh_wait,
+            min(
+                self.token_refresh_interval,
+                self._token_expiry - time.monotonic() - margin,
+            ),
+        )
+
     def update_connection_credentials(self, access_token):
         """
         Updates the connection credentials with the new access token.
@@ -240,6 +306,13 @@ class Application:
         # Set the prefix and configuration parameters
         self.prefix = prefix
         self.config = config
+        # message properties only depend on the configuration, so they are built once
+        self._message_properties = pika.BasicProperties(
+            expiration=self.config.rc.server_configuration.servers.rabbitmq.message_expiration,
+            delivery_mode=self.config.rc.server_configuration.servers.rabbitmq.delivery_mode,
+            content_type=self.config.rc.server_configuration.servers.rabbitmq.content_type,
+            app_id=self.app_name,
+        )
         self._is_running = True
 
         if self.config.rc.server_configuration.servers.rabbitmq.keycloak_authentication:
@@ -250,6 +323,21 @@ class Application:
             logger.info(
                 f"Keycloak authentication is enabled. Access token will be refreshed every {self.token_refresh_interval} seconds"
             )
+            # the Keycloak client is reused for every token request
+            keycloak = self.config.rc.server_configuration.servers.keycloak
+            # IPv6 literals may be configured with or without brackets
+            host = keycloak.host.strip("[]")
+            scheme = "http" if host in {"localhost", "127.0.0.1", "::1"} else "https"
+            # IPv6 literals must be bracketed in a URL
+            if ":" in host:
+                host = f"[{host}]"
+            self._keycloak_openid = KeycloakOpenID(
+                server_url=f"{scheme}://{host}:{keycloak.port}",
+                client_id=self.config.rc.credentials.client_id,
+                realm_name=keycloak.realm,
+                client_secret_key=self.config.rc.credentials.client_secret_key,
+                verify=False,
+            )
             access_token, _ = self.new_access_token()
             self.start_token_refresh_thread()
             credentials = pika.PlainCredentials("", access_token)
@@ -274,7 +362,12 @@ class Application:
         # Configure transport layer security (TLS) if needed
         if self.config.rc.server_configuration.servers.rabbitmq.tls:
             logger.info("Using TLS/SSL.")
-            parameters.ssl_options = pika.SSLOptions(ssl.SSLContext())
+            if self._ssl_context is None:
+                # reused across start-ups; certificates are not verified, as with the previous default SSLContext()
+                self._ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+                self._ssl_context.check_hostname = False
+                self._ssl_context.verify_mode = ssl.CERT_NONE
+            parameters.ssl_options = pika.SSLOptions(self._ssl_context)
 
         # Callback functions for connection
         def on_connection_open(connection):
@@ -334,6 +427,16 @@ class Application:
             channel (:obj:`pika.channel.Channel`): channel object
         """
         self.channel = channel
+        # queues must be declared again on a new channel
+        self._publish_routing_keys.clear()
+        self.declared_bindings.clear()
+        # delivery tags restart at 1 on a new channel
+        with self._publish_confirms:
+            self._publish_sequence = 0
+            self._unconfirmed_publishes.clear()
+            self._nacked_publishes.clear()
+            self._publish_confirms.notify_all()
+        self.channel.confirm_delivery(ack_nack_callback=self._on_publish_confirm)
         # Signal that connection is established
         self._is_connected.set()
 
@@ -385,29 +488,163 @@ class Application:
             app_topics (str or list): topic name or list of topic names
             payload (str): message payload
         """
+        if not payload:
+            logger.warning(f"Not sending message without a payload to {app_topics}.")
+            return
         if isinstance(app_topics, str):
             app_topics = [app_topics]
+        else:
+            # publish once per distinct topic, keeping the caller's order
+            app_topics = list(dict.fromkeys(app_topics))
+
+        # resolve every routing key before publishing so the frames are written back-to-back
+        routing_keys = [
+            self._publish_routing_key(app_name, app_topic) for app_topic in app_topics
+        ]
+        for routing_key in routing_keys:
+            self._publish(routing_key, payload)
+        self._wait_for_publish_confirms()
+        if logger.isEnabledFor(logging.DEBUG):
+            for routing_key in routing_keys:
+                logger.debug(
+                    f"Successfully sent message '{payload}' to topic '{routing_key}'."
+                )
+
+    def send_messages(self, app_name, app_topics, payloads) -> None:
+        """
+        Sends a batch of messages to the broker. Routing keys are resolved once per topic for the whole batch and the messages are published back-to-back, so the connection writes them out together rather than one at a time.
+
+        Args:
+            app_name (str): application name
+            app_topics (str or list): topic name or list of topic names
+            payloads (list): list of message payloads (str)
+        """
+        if isinstance(app_topics, str):
+            app_topics = [app_topics]
+        else:
+            app_topics = list(dict.fromkeys(app_topics))
+        if not all(payloads):
+            logger.warning(f"Not sending messages without a payload to {app_topics}.")
+            payloads = [payload for payload in payloads if payload]
 
         for app_topic in app_topics:
-            routing_key = self.create_routing_key(app_name=app_name, topic=app_topic)
-            if not self.predefined_exchanges_queues:
-                routing_key, queue_name = self.yamless_declare_bind_queue(
-                    routing_key=routing_key
+            routing_key = self._publish_routing_key(app_name, app_topic)
+            for payload in payloads:
+                self._publish(routing_key, payload)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Successfully sent {len(payloads)} messages to topic '{routing_key}'."
                 )
+        self._wait_for_publish_confirms()
+
+    def _publish(self, routing_key, payload, retries: int = 0):
+        """
+        Publishes a message to the exchange and tracks it until the broker confirms it. The delivery tag
+        is only recorded once the message has been handed to the channel.
+
+        Args:
+            routing_key (str): routing key
+            payload (str): message payload
+            retries (int): number of times the message has already been rejected by the broker
+        """
+        # the lock is held across the publish so a confirm cannot arrive before the tag is recorded
+        with self._publish_confirms:
             self.channel.basic_publish(
                 exchange=self.prefix,
                 routing_key=routing_key,
                 body=payload,
-                properties=pika.BasicProperties(
-                    expiration=self.config.rc.server_configuration.servers.rabbitmq.message_expiration,
-                    delivery_mode=self.config.rc.server_configuration.servers.rabbitmq.delivery_mode,
-                    content_type=self.config.rc.server_configuration.servers.rabbitmq.content_type,
-                    app_id=self.app_name,
-                ),
+                properties=self._message_properties,
             )
-            logger.debug(
-                f"Successfully sent message '{payload}' to topic '{routing_key}'."
+            self._publish_sequence += 1
+            self._unconfirmed_publishes[self._publish_sequence] = (
+                routing_key,
+                payload,
+                retries,
+            )
+
+    def _on_publish_confirm(self, frame):
+        """
+        Callback function for publisher confirms (Basic.Ack or Basic.Nack) from the broker.
+
+        Args:
+            frame (:obj:`pika.frame.Method`): confirmation frame
+        """
+        method = frame.method
+        nack = isinstance(method, pika.spec.Basic.Nack)
+        if nack:
+            logger.warning(
+                f"Broker rejected message with delivery tag {method.delivery_tag}"
+                + (" and earlier unconfirmed messages." if method.multiple else ".")
+            )
+        with self._publish_confirms:
+            if method.multiple:
+                tags = [
+                    tag
+                    for tag in self._unconfirmed_publishes
+                    if tag <= method.delivery_tag
+                ]
+            else:
+                tags = [method.delivery_tag]
+            for tag in tags:
+                message = self._unconfirmed_publishes.pop(tag, None)
+                if nack and message is not None:
+                    self._nacked_publishes.append(message)
+            self._publish_confirms.notify_all()
+
+    def _wait_for_publish_confirms(self, timeout: float = 10):
+        """
+        Blocks the calling thread while the number of unconfirmed messages is at the limit, so a
+        slow broker applies back-pressure instead of letting the send buffer grow, then republishes
+        messages rejected by the broker up to ``max_publish_retries`` times. Messages sent from
+        the I/O thread never wait, since that thread receives the confirms.
+
+        Args:
+            timeout (float): maximum number of seconds to wait
+        """
+        if threading.current_thread() is self._io_thread:
+            return
+        with self._publish_confirms:
+            if not self._publish_confirms.wait_for(
+                lambda: len(self._unconfirmed_publishes)
+                < self.max_unconfirmed_publishes,
+                timeout=timeout,
+            ):
+                logger.warning(
+                    f"{len(self._unconfirmed_publishes)} messages still unconfirmed by the broker after {timeout} s."
+                )
+            nacked, self._nacked_publishes = self._nacked_publishes, []
+        for routing_key, payload, retries in nacked:
+            if retries < self.max_publish_retries:
+                self._publish(routing_key, payload, retries + 1)
+            else:
+                logger.error(
+                    f"Dropping message to topic '{routing_key}' rejected by the broker {retries + 1} times."
+                )
+
+    def _publish_routing_key(self, app_name, app_topic):
+        """
+        Creates the routing key for publishing to a topic. Unless exchanges and queues are predefined,
+        the queue for the routing key is declared and bound the first time it is published to on the current channel.
+        Resolved routing keys are cached per application name and topic.
+
+        Args:
+            app_name (str): application name
+            app_topic (str): topic name
+
+        Returns:
+            str: routing key, or None if the queue could not be declared
+        """
+        routing_key = self._publish_routing_keys.get((app_name, app_topic))
+        if routing_key is not None:
+            return routing_key
+        routing_key = self.create_routing_key(app_name=app_name, topic=app_topic)
+        if not self.predefined_exchanges_queues:
+            routing_key, queue_name = self.yamless_declare_bind_queue(
+                routing_key=routing_key
             )
+        if routing_key is not None:
+            self._publish_routing_keys[(app_name, app_topic)] = routing_key
+        return routing_key
 
     def routing_key_matches_pattern(self, routing_key, pattern):
         """
@@ -509,6 +746,26 @@ class Application:
 
         # Add the callback to the list for this routing key
         self._callbacks_per_topic[routing_key].append(user_callback)
+        # invalidate callbacks resolved for received routing keys
+        self._callbacks_generation += 1
+
+    def remove_message_callback(
+        self, app_name: str, app_topic: str, user_callback: Callable
+    ):
+        """
+        Removes a callback added for a topic. The queue and consumer for the topic are kept.
+
+        Args:
+            app_name (str): application name
+            app_topic (str): topic name
+            user_callback (Callable): callback to remove
+        """
+        routing_key = self.create_routing_key(app_name=app_name, topic=app_topic)
+        callbacks = self._callbacks_per_topic.get(routing_key, [])
+        if user_callback in callbacks:
+            callbacks.remove(user_callback)
+            # invalidate callbacks resolved for received routing keys
+            self._callbacks_generation += 1
 
     def _handle_message(self, ch, method, properties, body):
         """
@@ -516,31 +773,21 @@ class Application:
         Supports both direct routing key matches and wildcard patterns.
         """
         routing_key = method.routing_key
-        logger.debug(f"Received message with routing key: {routing_key}")
-
-        # First check for exact routing key match
-        direct_callbacks = self._callbacks_per_topic.get(routing_key, [])
+        # skip building log messages on the per-message path unless they will be emitted
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Received message with routing key: {routing_key}")
 
-        # Then find any wildcard patterns that match this routing key
-        wildcard_callbacks = []
-        for pattern, callbacks in self._callbacks_per_topic.items():
-            # Skip exact matches (already handled) and patterns that don't match
-            if pattern == routing_key:
-                continue
-
-            if "*" in pattern or "#" in pattern:
-                if self.routing_key_matches_pattern(routing_key, pattern):
-                    wildcard_callbacks.extend(callbacks)
-
-        # Combine all matching callbacks
-        all_callbacks = direct_callbacks + wildcard_callbacks
+        all_callbacks = self._callbacks_for_routing_key(routing_key)
 
         if all_callbacks:
-            logger.debug(
-                f"Found {len(all_callbacks)} callbacks for routing key: {routing_key}"
-            )
+            if debug:
+                logger.debug(
+                    f"Found {len(all_callbacks)} callbacks for routing key: {routing_key}"
+                )
         else:
-            logger.debug(f"No callbacks found for routing key: {routing_key}")
+            if debug:
+                logger.debug(f"No callbacks found for routing key: {routing_key}")
             # Still acknowledge the message even if no callbacks matched
             self.acknowledge_message(method.delivery_tag)
             return
@@ -560,6 +807,41 @@ class Application:
                     delivery_tag=method.delivery_tag, requeue=True
                 )
 
+    def _callbacks_for_routing_key(self, routing_key):
+        """
+        Finds the callbacks for a received routing key, including those of matching wildcard patterns.
+        The result is cached per routing key until another callback is added.
+
+        Args:
+            routing_key (str): routing key of the received message
+
+        Returns:
+            list: callbacks in order of exact matches, then wildcard matches
+        """
+        generation = self._callbacks_generation
+        cached = self._callbacks_per_routing_key.get(routing_key)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        # First check for exact routing key match
+        direct_callbacks = self._callbacks_per_topic.get(routing_key, [])
+
+        # Then find any wildcard patterns that match this routing key
+        wildcard_callbacks = []
+        for pattern, callbacks in list(self._callbacks_per_topic.items()):
+            # Skip exact matches (already handled) and patterns that don't match
+            if pattern == routing_key:
+                continue
+
+            if "*" in pattern or "#" in pattern:
+                if self.routing_key_matches_pattern(routing_key, pattern):
+                    wildcard_callbacks.extend(callbacks)
+
+        # Combine all matching callbacks
+        all_callbacks = direct_callbacks + wildcard_callbacks
+        self._callbacks_per_routing_key[routing_key] = (generation, all_callbacks)
+        return all_callbacks
+
     def acknowledge_message(self, delivery_tag):
         """Acknowledge the message delivery from RabbitMQ by sending a
         Basic.Ack RPC method for the delivery tag.
@@ -567,56 +849,73 @@ class Application:
         :param int delivery_tag: The delivery tag from the Basic.Deliver frame
 
         """
-        try:
+        channel = self.channel
+        if channel is None or not channel.is_open:
+            return
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Acknowledging message {delivery_tag}")
-            self.channel.basic_ack(delivery_tag, True)
-        except:
+        try:
+            channel.basic_ack(delivery_tag, True)
+        except pika.exceptions.ChannelWrongStateError:
+            # the channel closed between the check and the acknowledgement
             pass
 
-    def create_routing_key(self, app_name: str, topic: str):
+    def create_routing_key(self, app_name: str, topic: str) -> str:
         """
         Creates a routing key for the application. The routing key is used to bind the queue to the exchange.
 
         Args:
             app_name (str): application name
             topic (str): topic name
+
+        Returns:
+            str: routing key in the form ``prefix.app_name.topic``
         """
-        routing_key = ".".join([self.prefix, app_name, topic])
+        routing_key = f"{self.prefix}.{app_name}.{topic}"
         return routing_key
 
     def yamless_declare_bind_queue(
         self, routing_key: str = None, app_specific_extender: str = None
-    ) -> None:
+    ) -> tuple:
         """
         Declares and binds a queue to the exchange. The queue is bound to the exchange using the routing key. The routing key is created using the application name and topic.
+
         Args:
-            app_name (str): application name
-            topic (str): topic name
+            routing_key (str): routing key as returned by :obj:`create_routing_key`, used verbatim
             app_specific_extender (str): application specific extender, used to create a unique queue name for the application. If the app_specific_extender is not provided, the queue name is the same as the routing key.
+
+        Returns:
+            tuple: routing key and queue name, or (None, None) if the queue could not be declared
         """
+        if app_specific_extender:
+            queue_name = f"{routing_key}.{app_specific_extender}"
+        else:
+            queue_name = routing_key
+        if (self.prefix, queue_name, routing_key) in self.declared_bindings:
+            return routing_key, queue_name
         try:
-            if app_specific_extender:
-                queue_name = ".".join([routing_key, app_specific_extender])
-            else:
-                queue_name = routing_key
             self.channel.queue_declare(
                 queue=queue_name, durable=False, auto_delete=True
             )
             self.channel.queue_bind(
                 exchange=self.prefix, queue=queue_name, routing_key=routing_key
             )
-            # Create list of declared queues and exchanges
-            self.declared_queues.add(queue_name.strip())
-            self.declared_queues.add(routing_key.strip())
-            self.declared_exchanges.add(self.prefix.strip())
+        except (
+            pika.exceptions.AMQPChannelError,
+            pika.exceptions.AMQPConnectionError,
+        ) as e:
+            logger.error(
+                f"Failed to bind queue '{queue_name}' to topic '{routing_key}': {e}"
+            )
+            return None, None
+        # Create list of declared queues and exchanges
+        self.declared_queues.update((queue_name, routing_key))
+        self.declared_exchanges.add(self.prefix)
+        self.declared_bindings.add((self.prefix, queue_name, routing_key))
 
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Bound queue '{queue_name}' to topic '{routing_key}'.")
 
-        except:
-            routing_key = None
-            queue_name = None
-            pass
-
         return routing_key, queue_name
 
     def delete_queue(self, configs, app_name):
@@ -736,25 +1035,71 @@ class Application:
     ) -> None:
         """
         Issues a Network Time Protocol (NTP) request to determine the system clock offset.
+        Requests are sent concurrently to up to three addresses of the host and the first response is used.
+        A successful offset is reused for an hour by later calls on the same application.
 
         Args:
             host (str): NTP host (default: 'pool.ntp.org')
             retry_delay_s (int): number of seconds to wait before retrying
             max_retry (int): maximum number of retries allowed
         """
+        if (
+            self._wallclock_offset_expiry is not None
+            and time.monotonic() < self._wallclock_offset_expiry
+        ):
+            logger.info("Reusing wallclock offset from a recent NTP request.")
+            return
         for i in range(max_retry):
-            try:
-                logger.info(f"Contacting {host} to retrieve wallclock offset.")
-                response = ntplib.NTPClient().request(host, version=3, timeout=2)
+            logger.info(f"Contacting {host} to retrieve wallclock offset.")
+            response = self._request_ntp(host)
+            if response is not None:
                 offset = timedelta(seconds=response.offset)
                 self.simulator.set_wallclock_offset(offset)
+                self._wallclock_offset_expiry = time.monotonic() + 3600
                 logger.info(f"Wallclock offset updated to {offset}.")
                 return
-            except ntplib.NTPException:
-                logger.warn(
-                    f"Could not connect to {host}, attempt #{i+1}/{max_retry} in {retry_delay_s} s."
+            logger.warning(
+                f"Could not connect to {host}, attempt #{i+1}/{max_retry} in {retry_delay_s} s."
+            )
+            time.sleep(retry_delay_s)
+
+    def _request_ntp(self, host, max_addresses: int = 3):
+        """
+        Sends NTP requests concurrently to the addresses of a host.
+
+        Args:
+            host (str): NTP host
+            max_addresses (int): maximum number of addresses to query
+
+        Returns:
+            :obj:`NTPStats`: first successful response, or None if no address responded
+        """
+        try:
+            addresses = list(
+                dict.fromkeys(
+                    info[4][0]
+                    for info in socket.getaddrinfo(host, 123, type=socket.SOCK_DGRAM)
+                )
+            )[:max_addresses]
+        except socket.gaierror:
+            return None
+        pool = ThreadPoolExecutor(max_workers=len(addresses))
+        try:
+            futures = [
+                pool.submit(
+                    ntplib.NTPClient().request, address, version=3, timeout=2
                 )
-                time.sleep(retry_delay_s)
+                for address in addresses
+            ]
+            for future in as_completed(futures):
+                try:
+                    return future.result()
+                except (ntplib.NTPException, OSError):
+                    continue
+            return None
+        finally:
+            # do not wait for slower responders once one has answered
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def _create_time_status_publisher(
         self, time_status_step: timedelta, time_status_init: datetime
@@ -177,7 +177,8 @@ class LoggerApplication(Application):
                 routing_key = method.routing_key
                 payload = body.decode("utf-8") if isinstance(body, bytes) else str(body)
 
-                logger.debug(f"Logger {self.app_name} logging message: {payload}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Logger {self.app_name} logging message: {payload}")
 
                 timestamp = self.simulator.get_wallclock_time()
                 self.log_file.write(f"{timestamp},{routing_key},{payload}\n")
@@ -0,0 +1,353 @@
+import unittest
+from datetime import timedelta
+import socket
+from types import SimpleNamespace
+from unittest import mock
+import threading
+import time
+
+import ntplib
+import pika
+
+from nost_tools.application import Application
+
+
+def ack(delivery_tag, multiple=False):
+    return SimpleNamespace(
+        method=pika.spec.Basic.Ack(delivery_tag=delivery_tag, multiple=multiple)
+    )
+
+
+def nack(delivery_tag, multiple=False):
+    return SimpleNamespace(
+        method=pika.spec.Basic.Nack(delivery_tag=delivery_tag, multiple=multiple)
+    )
+
+
+class TestApplicationPublishConfirms(unittest.TestCase):
+    def setUp(self):
+        # configure an application with a mocked channel
+        self.app = Application("test")
+        self.app.prefix = "prefix"
+        self.app.config = mock.MagicMock()
+        self.app.on_channel_open(mock.MagicMock())
+
+    def test_single_ack(self):
+        self.app._publish("prefix.test.a", "1")
+        self.app._publish("prefix.test.a", "2")
+        self.app._on_publish_confirm(ack(1))
+        self.assertEqual(list(self.app._unconfirmed_publishes), [2])
+
+    def test_multiple_ack(self):
+        for payload in ["1", "2", "3"]:
+            self.app._publish("prefix.test.a", payload)
+        self.app._on_publish_confirm(ack(2, multiple=True))
+        self.assertEqual(list(self.app._unconfirmed_publishes), [3])
+
+    def test_nack_republishes(self):
+        self.app._publish("prefix.test.a", "1")
+        self.app._on_publish_confirm(nack(1))
+        self.assertEqual(self.app._unconfirmed_publishes, {})
+        self.app._wait_for_publish_confirms()
+        # the rejected message is published again under a new delivery tag
+        self.assertEqual(self.app.channel.basic_publish.call_count, 2)
+        self.assertEqual(
+            self.app._unconfirmed_publishes, {2: ("prefix.test.a", "1", 1)}
+        )
+
+    def test_nack_dropped_after_retries(self):
+        self.app.max_publish_retries = 0
+        self.app._publish("prefix.test.a", "1")
+        self.app._on_publish_confirm(nack(1))
+        with self.assertLogs("nost_tools.application", level="ERROR"):
+            self.app._wait_for_publish_confirms()
+        self.assertEqual(self.app.channel.basic_publish.call_count, 1)
+        self.assertEqual(self.app._unconfirmed_publishes, {})
+
+    def test_failed_publish_is_not_tracked(self):
+        self.app.channel.basic_publish.side_effect = (
+            pika.exceptions.ChannelWrongStateError("closed")
+        )
+        with self.assertRaises(pika.exceptions.ChannelWrongStateError):
+            self.app._publish("prefix.test.a", "1")
+        self.assertEqual(self.app._publish_sequence, 0)
+        self.assertEqual(self.app._unconfirmed_publishes, {})
+
+    def test_channel_open_resets_confirms(self):
+        self.app._publish("prefix.test.a", "1")
+        self.app._publish("prefix.test.a", "2")
+        self.app._on_publish_confirm(nack(1))
+        self.app.on_channel_open(mock.MagicMock())
+        self.assertEqual(self.app._publish_sequence, 0)
+        self.assertEqual(self.app._unconfirmed_publishes, {})
+        self.assertEqual(self.app._nacked_publishes, [])
+        # delivery tags restart at 1 on the new channel
+        self.app._publish("prefix.test.a", "3")
+        self.assertEqual(list(self.app._unconfirmed_publishes), [1])
+
+    def test_wait_blocks_until_confirmed(self):
+        self.app.max_unconfirmed_publishes = 1
+        self.app._publish("prefix.test.a", "1")
+        confirm = threading.Timer(0.1, self.app._on_publish_confirm, [ack(1)])
+        confirm.start()
+        start = time.monotonic()
+        self.app._wait_for_publish_confirms(timeout=5)
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(self.app._unconfirmed_publishes, {})
+        confirm.join()
+
+    def test_wait_times_out(self):
+        self.app.max_unconfirmed_publishes = 1
+        self.app._publish("prefix.test.a", "1")
+        with self.assertLogs("nost_tools.application", level="WARNING"):
+            self.app._wait_for_publish_confirms(timeout=0.05)
+        self.assertEqual(list(self.app._unconfirmed_publishes), [1])
+
+
+class TestApplicationSendMessage(unittest.TestCase):
+    def setUp(self):
+        # configure an application with a mocked channel and predefined queues
+        self.app = Application("test")
+        self.app.prefix = "prefix"
+        self.app.config = mock.MagicMock()
+        self.app.predefined_exchanges_queues = True
+        self.app.on_channel_open(mock.MagicMock())
+
+    def published(self):
+        return [
+            (call.kwargs["routing_key"], call.kwargs["body"])
+            for call in self.app.channel.basic_publish.call_args_list
+        ]
+
+    def test_send_message_skips_empty_payload(self):
+        for payload in [None, ""]:
+            with self.assertLogs("nost_tools.application", level="WARNING"):
+                self.app.send_message("test", "a", payload)
+        self.assertEqual(self.published(), [])
+
+    def test_send_messages_skips_empty_payloads(self):
+        with self.assertLogs("nost_tools.application", level="WARNING"):
+            self.app.send_messages("test", "a", [None, "1", ""])
+        self.assertEqual(self.published(), [("prefix.test.a", "1")])
+
+
+class TestApplicationAccessToken(unittest.TestCase):
+    def setUp(self):
+        # configure an application with a mocked Keycloak client
+        self.app = Application("test")
+        self.app._keycloak_openid = mock.MagicMock()
+        self.active = 0
+        self.max_active = 0
+        self.count = 0
+
+    def refresh_token(self, refresh_token):
+        # record how many requests are in flight at once
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        self.count += 1
+        self.active -= 1
+        return {
+            "access_token": f"access-{self.count}",
+            "refresh_token": f"refresh-{self.count}",
+            "expires_in": 300,
+        }
+
+    def test_requests_are_serialized(self):
+        self.app._keycloak_openid.refresh_token.side_effect = self.refresh_token
+        threads = [
+            threading.Thread(target=self.app.new_access_token, args=["refresh-0"])
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.max_active, 1)
+        # the stored tokens come from the same (last) response
+        self.assertEqual(self.app._access_token, "access-3")
+        self.assertEqual(self.app.refresh_token, "refresh-3")
+
+
+class TestApplicationTokenRefresh(unittest.TestCase):
+    def setUp(self):
+        # configure an application with a mocked Keycloak client
+        self.app = Application("test")
+        self.app._keycloak_openid = mock.MagicMock()
+        self.app.config = mock.MagicMock()
+        self.app.token_refresh_interval = 60
+
+    def set_token(self, **token):
+        self.app._keycloak_openid.token.return_value = dict(
+            access_token="access", refresh_token="refresh", **token
+        )
+        self.app.new_access_token()
+
+    def test_missing_expires_in(self):
+        self.set_token()
+        self.assertEqual(self.app._next_token_refresh(), 60)
+
+    def test_long_lived_token(self):
+        self.set_token(expires_in=300)
+        self.assertEqual(self.app._next_token_refresh(), 60)
+
+    def test_short_lived_token(self):
+        # refreshed once 80% of the lifetime has elapsed
+        self.set_token(expires_in=30)
+        self.assertAlmostEqual(self.app._next_token_refresh(), 24, delta=0.5)
+
+    def test_clamp_at_min_wait(self):
+        self.set_token(expires_in=4)
+        self.assertEqual(self.app._next_token_refresh(), 5)
+        # an expired token is retried no sooner than the minimum wait
+        self.app._token_expiry = time.monotonic() - 10
+        self.assertEqual(self.app._next_token_refresh(), 5)
+        self.app.min_token_refresh_wait = 1
+        self.assertEqual(self.app._next_token_refresh(), 1)
+
+
+class FakeNTPClient:
+    # responses (offset in seconds or exception) and delays (seconds) by address
+    responses = {}
+    delays = {}
+
+    def request(self, address, version=3, timeout=2):
+        time.sleep(self.delays.get(address, 0))
+        response = self.responses[address]
+        if isinstance(response, Exception):
+            raise response
+        return SimpleNamespace(offset=response)
+
+
+class TestApplicationWallclockOffset(unittest.TestCase):
+    def setUp(self):
+        self.app = Application("test")
+        addresses = [
+            (socket.AF_INET, socket.SOCK_DGRAM, 17, "", (address, 123))
+            for address in ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+        ]
+        patches = [
+            mock.patch("socket.getaddrinfo", return_value=addresses),
+            mock.patch("ntplib.NTPClient", FakeNTPClient),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        FakeNTPClient.responses = {}
+        FakeNTPClient.delays = {}
+
+    def test_first_response_wins(self):
+        FakeNTPClient.responses = {
+            "10.0.0.1": 1.0,
+            "10.0.0.2": 2.0,
+            "10.0.0.3": ntplib.NTPException("no response"),
+        }
+        FakeNTPClient.delays = {"10.0.0.1": 0.2}
+        self.assertEqual(self.app._request_ntp("pool.ntp.org").offset, 2.0)
+
+    def test_all_addresses_fail(self):
+        FakeNTPClient.responses = {
+            "10.0.0.1": ntplib.NTPException("no response"),
+            "10.0.0.2": OSError("unreachable"),
+            "10.0.0.3": ntplib.NTPException("no response"),
+        }
+        self.assertIsNone(self.app._request_ntp("pool.ntp.org"))
+        with self.assertLogs("nost_tools.application", level="WARNING"):
+            self.app.set_wallclock_offset(retry_delay_s=0, max_retry=2)
+        self.assertEqual(self.app.simulator._wallclock_offset, timedelta())
+        self.assertIsNone(self.app._wallclock_offset_expiry)
+
+    def test_cached_offset_is_reused(self):
+        FakeNTPClient.responses = {
+            address: 1.5 for address in ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+        }
+        self.app.set_wallclock_offset()
+        self.assertEqual(self.app.simulator._wallclock_offset, timedelta(seconds=1.5))
+        with mock.patch.object(
+            self.app, "_request_ntp", return_value=SimpleNamespace(offset=2.5)
+        ) as request_ntp:
+            self.app.set_wallclock_offset()
+            request_ntp.assert_not_called()
+            # an expired offset is requested again
+            self.app._wallclock_offset_expiry = time.monotonic() - 1
+            self.app.set_wallclock_offset()
+            request_ntp.assert_called_once()
+        self.assertEqual(self.app.simulator._wallclock_offset, timedelta(seconds=2.5))
+
+
+class TestApplicationMessageCallbacks(unittest.TestCase):
+    def setUp(self):
+        # configure an application with a mocked channel
+        self.app = Application("test")
+        self.app.prefix = "prefix"
+        self.app.on_channel_open(mock.MagicMock())
+        self.received = []
+
+    def callback(self, name):
+        return lambda ch, method, properties, body: self.received.append(name)
+
+    def dispatch(self, routing_key):
+        self.received = []
+        self.app._handle_message(
+            self.app.channel,
+            SimpleNamespace(routing_key=routing_key, delivery_tag=1),
+            None,
+            b"{}",
+        )
+        return self.received
+
+    def test_added_callback_applies_to_next_message(self):
+        self.app.add_message_callback("source", "a", self.callback("first"))
+        self.assertEqual(self.dispatch("prefix.source.a"), ["first"])
+        self.app.add_message_callback("source", "a", self.callback("second"))
+        self.app.add_message_callback("*", "a", self.callback("wildcard"))
+        self.assertEqual(
+            self.dispatch("prefix.source.a"), ["first", "second", "wildcard"]
+        )
+
+    def test_removed_callback_applies_to_next_message(self):
+        first = self.callback("first")
+        self.app.add_message_callback("source", "a", first)
+        self.app.add_message_callback("source", "a", self.callback("second"))
+        self.assertEqual(self.dispatch("prefix.source.a"), ["first", "second"])
+        self.app.remove_message_callback("source", "a", first)
+        self.assertEqual(self.dispatch("prefix.source.a"), ["second"])
+
+
+class TestApplicationDeclarations(unittest.TestCase):
+    def setUp(self):
+        # configure an application with a mocked channel
+        self.app = Application("test")
+        self.app.prefix = "prefix"
+        self.app.on_channel_open(mock.MagicMock())
+
+    def test_binding_declared_once_per_channel(self):
+        for _ in range(2):
+            self.assertEqual(
+                self.app.yamless_declare_bind_queue("prefix.test.a"),
+                ("prefix.test.a", "prefix.test.a"),
+            )
+        self.app.channel.queue_declare.assert_called_once()
+        self.app.channel.queue_bind.assert_called_once()
+
+    def test_binding_declared_again_on_new_channel(self):
+        self.app.yamless_declare_bind_queue("prefix.test.a")
+        # the non-durable queue is lost with the old channel
+        self.app.on_channel_open(mock.MagicMock())
+        self.assertEqual(self.app.declared_bindings, set())
+        self.app.yamless_declare_bind_queue("prefix.test.a")
+        self.app.channel.queue_declare.assert_called_once()
+        self.app.channel.queue_bind.assert_called_once_with(
+            exchange="prefix", queue="prefix.test.a", routing_key="prefix.test.a"
+        )
+
+    def test_failed_binding_is_not_recorded(self):
+        self.app.channel.queue_bind.side_effect = (
+            pika.exceptions.ChannelWrongStateError("closed")
+        )
+        with self.assertLogs("nost_tools.application", level="ERROR"):
+            self.assertEqual(
+                self.app.yamless_declare_bind_queue("prefix.test.a"), (None, None)
+            )
+        self.assertEqual(self.app.declared_bindings, set())